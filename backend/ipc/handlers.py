@@ -6,6 +6,7 @@ Heavy ML dependencies are lazy-imported to keep startup fast.
 
 from __future__ import annotations
 
+import threading
 from collections.abc import Callable
 from typing import Any
 
@@ -18,6 +19,12 @@ from ipc.protocol import IPCMessage, IPCResponse, MessageType, ResponseType
 _db_instance: Any = None
 _db_instance_path: str | None = None
 _transcription_engines: dict[str, Any] = {}
+# Held while an engine is looked up or created, so concurrent first requests
+# load one model. Transcribe calls run outside it and are not thread-safe: they
+# re-pin mlx_whisper's process-global ModelHolder and update engine fields
+# without a lock. That is safe only because main.py handles one request at a
+# time; a threaded dispatcher would need a lock around each transcribe call.
+_transcription_lock = threading.Lock()
 
 # Default settings values
 _SETTINGS_DEFAULTS: dict[str, str] = {
@@ -78,6 +85,18 @@ def _get_summary_dir() -> str:
     return os.environ.get("SECOND_SUMMARIES_DIR", "summaries")
 
 
+def _get_transcription_engine(cache_key: str, language: str | None = None) -> Any:
+    """Return the cached TranscriptionEngine for cache_key, loading it on first use."""
+    with _transcription_lock:
+        if cache_key not in _transcription_engines:
+            from transcription.engine import TranscriptionEngine
+
+            engine = TranscriptionEngine(language=language)
+            engine.load_model()
+            _transcription_engines[cache_key] = engine
+        return _transcription_engines[cache_key]
+
+
 def _merge_diarization_with_transcript(
     diarization_segments: list[Any],
     transcript_segments: list[Any],
@@ -134,15 +153,8 @@ def handle_transcribe_chunk(msg: IPCMessage) -> IPCResponse:
     language: str | None = msg.payload.get("language")
 
     try:
-        from transcription.engine import TranscriptionEngine
-
         # Reuse engine per language to avoid reloading the model each call
-        cache_key = language or "_auto"
-        if cache_key not in _transcription_engines:
-            engine = TranscriptionEngine(language=language)
-            engine.load_model()
-            _transcription_engines[cache_key] = engine
-        engine = _transcription_engines[cache_key]
+        engine = _get_transcription_engine(language or "_auto", language)
         segments = engine.transcribe(audio_bytes, initial_prompt=initial_prompt)
 
         full_text = "".join(seg.text for seg in segments).strip()
@@ -194,19 +206,13 @@ def handle_diarize(msg: IPCMessage) -> IPCResponse:
 
     try:
         from diarization.pipeline import DiarizationPipeline
-        from transcription.engine import TranscriptionEngine
 
         pipeline = DiarizationPipeline()
         pipeline.load()
         result = pipeline.diarize(audio_path, num_speakers=num_speakers)
         embeddings = pipeline.extract_embeddings(audio_path, result.segments)
 
-        cache_key = "_file"
-        if cache_key not in _transcription_engines:
-            engine = TranscriptionEngine()
-            engine.load_model()
-            _transcription_engines[cache_key] = engine
-        engine = _transcription_engines[cache_key]
+        engine = _get_transcription_engine("_file")
         transcript_segments = engine.transcribe_file(audio_path)
 
         segments_data = _merge_diarization_with_transcript(result.segments, transcript_segments)
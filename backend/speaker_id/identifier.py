@@ -7,15 +7,30 @@ database to identify returning speakers across meetings.
 from __future__ import annotations
 
 import math
-import struct
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
 if TYPE_CHECKING:
     from db.database import DatabaseManager
 
 
-@dataclass
+def _as_f32(vec: ArrayLike) -> NDArray[np.float32]:
+    """Convert embedding input to float32, the native pyannote dtype (no copy if already so)."""
+    return np.asarray(vec, dtype=np.float32)
+
+
+def _normalize_rows(matrix: NDArray[np.float32]) -> NDArray[np.float32]:
+    """Scale each row of a float32 matrix to unit L2 norm in place (zero rows stay zero)."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.maximum(norms, 1e-12, out=norms)
+    matrix /= norms
+    return matrix
+
+
+@dataclass(slots=True, frozen=True)
 class SpeakerMatch:
     """A match between a diarization label and a known speaker.
 
@@ -63,26 +78,44 @@ class SpeakerIdentifier:
         Returns:
             List of speaker matches with confidence scores.
         """
-        if known_embeddings is None:
-            known_embeddings = {}
+        if not known_embeddings:
+            # Nothing to compare against (e.g. first run) -- skip all array setup.
+            return [
+                SpeakerMatch(speaker_label=label, matched_name=None, confidence=0.0)
+                for label in embeddings
+            ]
 
-        matches: list[SpeakerMatch] = []
-        for label, embedding in embeddings.items():
-            best_name: str | None = None
-            best_similarity: float = 0.0
+        known_unit = _normalize_rows(_as_f32(list(known_embeddings.values())))
+        return self._match(embeddings, list(known_embeddings), known_unit)
 
-            for name, known_vec in known_embeddings.items():
-                sim = self.cosine_similarity(embedding, known_vec)
-                if sim > best_similarity:
-                    best_similarity = sim
-                    best_name = name
+    def _match(
+        self,
+        embeddings: dict[str, list[float]],
+        known_names: list[str],
+        known_unit: NDArray[np.float32],
+    ) -> list[SpeakerMatch]:
+        """Match embeddings against a non-empty (K, D) matrix of unit-normalized known vectors.
+
+        All queries are normalized and stacked into an (N, D) matrix so the N x K
+        similarity matrix comes out of a single matrix product.
+        """
+        labels = list(embeddings)
+        if not labels:
+            return []
 
-            if best_name is not None and best_similarity >= self.similarity_threshold:
+        queries = _normalize_rows(_as_f32(list(embeddings.values())))
+        similarities = queries @ known_unit.T
+        best = similarities.argmax(axis=1)
+        best_similarity = similarities[np.arange(len(labels)), best]
+
+        matches: list[SpeakerMatch] = []
+        for label, index, similarity in zip(labels, best.tolist(), best_similarity.tolist()):
+            if similarity > 0.0 and similarity >= self.similarity_threshold:
                 matches.append(
                     SpeakerMatch(
                         speaker_label=label,
-                        matched_name=best_name,
-                        confidence=best_similarity,
+                        matched_name=known_names[index],
+                        confidence=similarity,
                     )
                 )
             else:
@@ -90,7 +123,7 @@ class SpeakerIdentifier:
                     SpeakerMatch(
                         speaker_label=label,
                         matched_name=None,
-                        confidence=best_similarity,
+                        confidence=max(similarity, 0.0),
                     )
                 )
 
@@ -111,15 +144,15 @@ class SpeakerIdentifier:
         if self.db is None:
             raise RuntimeError("Database not configured. Pass a db to SpeakerIdentifier.")
 
-        speakers = self.db.get_all_speakers()
-        known_embeddings: dict[str, list[float]] = {}
-        for speaker in speakers:
-            stored_blob = speaker["embedding"]
-            if stored_blob is None:
-                continue
-            known_embeddings[speaker["name"]] = self.deserialize_embedding(stored_blob)
+        speakers = [sp for sp in self.db.get_all_speakers() if sp["embedding"] is not None]
+        if not speakers:
+            return self.identify(embeddings)
 
-        return self.identify(embeddings, known_embeddings=known_embeddings)
+        # View each stored blob as float32 directly instead of round-tripping via lists.
+        known_unit = _normalize_rows(
+            np.vstack([np.frombuffer(sp["embedding"], dtype=np.float32) for sp in speakers])
+        )
+        return self._match(embeddings, [sp["name"] for sp in speakers], known_unit)
 
     def update_speaker_embedding(self, speaker_id: int, new_embedding: list[float]) -> None:
         """Update a speaker's stored embedding using a running average.
@@ -142,19 +175,19 @@ class SpeakerIdentifier:
         old_blob = speaker["embedding"]
         old_count: int = speaker["embedding_count"]
 
+        new_vec = _as_f32(new_embedding)
+
         if old_blob is None or old_count == 0:
             # First embedding -- store as-is
-            updated = new_embedding
+            updated = new_vec
             new_count = 1
         else:
-            old_embedding = self.deserialize_embedding(old_blob)
             new_count = old_count + 1
-            updated = [
-                (old_val * old_count + new_val) / new_count
-                for old_val, new_val in zip(old_embedding, new_embedding)
-            ]
+            updated = np.frombuffer(old_blob, dtype=np.float32) * np.float32(old_count)
+            updated += new_vec
+            updated /= np.float32(new_count)
 
-        self.db.update_speaker_embedding(speaker_id, self.serialize_embedding(updated), new_count)
+        self.db.update_speaker_embedding(speaker_id, updated.tobytes(), new_count)
 
     @staticmethod
     def cosine_similarity(vec_a: list[float], vec_b: list[float]) -> float:
@@ -168,14 +201,15 @@ class SpeakerIdentifier:
             Similarity score between -1.0 and 1.0.
             Returns 0.0 if either vector has zero magnitude.
         """
-        dot = sum(a * b for a, b in zip(vec_a, vec_b))
-        norm_a = math.sqrt(sum(a * a for a in vec_a))
-        norm_b = math.sqrt(sum(b * b for b in vec_b))
+        a = _as_f32(vec_a)
+        b = _as_f32(vec_b)
+        # Three BLAS dot products; cheaper than np.linalg.norm's generic dispatch.
+        norm_sq = float(a @ a) * float(b @ b)
 
-        if norm_a == 0.0 or norm_b == 0.0:
+        if norm_sq == 0.0:
             return 0.0
 
-        return dot / (norm_a * norm_b)
+        return float(a @ b) / math.sqrt(norm_sq)
 
     @staticmethod
     def serialize_embedding(embedding: list[float]) -> bytes:
@@ -185,21 +219,20 @@ class SpeakerIdentifier:
             embedding: List of float values (typically 256-dim).
 
         Returns:
-            Bytes packed as float32 values using struct.
+            Bytes containing the values as native-endian float32.
         """
-        return struct.pack(f"{len(embedding)}f", *embedding)
+        return _as_f32(embedding).tobytes()
 
     @staticmethod
     def deserialize_embedding(data: bytes) -> list[float]:
         """Unpack bytes back to a float list.
 
         Args:
-            data: Bytes containing struct-packed float32 values.
+            data: Bytes containing native-endian float32 values.
 
         Returns:
             List of float values.
         """
         if len(data) == 0:
             return []
-        count = len(data) // 4
-        return list(struct.unpack(f"{count}f", data))
+        return np.frombuffer(data, dtype=np.float32).tolist()  # type: ignore[no-any-return]
@@ -2,17 +2,23 @@
 
 from __future__ import annotations
 
+import datetime
+import os
 import re
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 
-_DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+# \A/\Z rather than ^/$: "$" also matches before a trailing newline.
+_DATE_PATTERN = re.compile(r"\A\d{4}-\d{2}-\d{2}\Z")
+_UNSAFE_NAME_CHARS = re.compile(r"[^a-z0-9_\-]")
 
 
 class SummaryFileManager:
     """Manages markdown summary file storage organized by person and date."""
 
     def __init__(self, base_dir: str | Path) -> None:
-        """Initialize with base directory for summaries."""
+        """Initialize with base directory for summaries (resolved once, here)."""
         self.base_dir = Path(base_dir).resolve()
 
     def save_summary(self, speaker_name: str, date: str, content: str) -> Path:
@@ -28,7 +34,17 @@ class SummaryFileManager:
         """
         path = self.get_summary_path(speaker_name, date)
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content)
+        # Write to a uniquely named sibling temp file and rename over the target,
+        # so a crash mid-write never leaves a truncated summary behind and two
+        # concurrent saves of the same summary never share a temp file.
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(content)
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
         return path
 
     def get_summary(self, speaker_name: str, date: str) -> str | None:
@@ -40,17 +56,25 @@ class SummaryFileManager:
 
     def list_speakers(self) -> list[str]:
         """List all speakers who have summaries, sorted alphabetically."""
-        if not self.base_dir.exists():
+        try:
+            with os.scandir(self.base_dir) as entries:
+                return sorted(entry.name for entry in entries if entry.is_dir())
+        except FileNotFoundError:
             return []
-        return sorted(entry.name for entry in self.base_dir.iterdir() if entry.is_dir())
 
     def list_summaries_for_speaker(self, speaker_name: str) -> list[str]:
         """List all summary dates for a speaker, sorted chronologically."""
         sanitized = self.sanitize_speaker_name(speaker_name)
         speaker_dir = self.base_dir / sanitized
-        if not speaker_dir.exists():
+        try:
+            with os.scandir(speaker_dir) as entries:
+                return sorted(
+                    entry.name.removesuffix(".md")
+                    for entry in entries
+                    if entry.is_file() and entry.name.endswith(".md")
+                )
+        except FileNotFoundError:
             return []
-        return sorted(path.stem for path in speaker_dir.iterdir() if path.suffix == ".md")
 
     def delete_summary(self, speaker_name: str, date: str) -> bool:
         """Delete a summary file. Returns True if deleted, False if not found."""
@@ -62,19 +86,28 @@ class SummaryFileManager:
 
     @staticmethod
     def validate_date(date: str) -> None:
-        """Validate date is in YYYY-MM-DD format to prevent path traversal."""
-        if not _DATE_PATTERN.match(date):
-            raise ValueError(
-                f"Invalid date format: {date!r}. Must be YYYY-MM-DD (e.g. '2026-02-08')"
-            )
+        """Validate date is a real calendar date in YYYY-MM-DD format.
+
+        The strict format check also prevents path traversal via the date.
+        """
+        if _DATE_PATTERN.match(date):
+            try:
+                datetime.date.fromisoformat(date)
+                return
+            except ValueError:
+                pass
+        raise ValueError(f"Invalid date format: {date!r}. Must be YYYY-MM-DD (e.g. '2026-02-08')")
 
     def get_summary_path(self, speaker_name: str, date: str) -> Path:
         """Get the expected path for a summary file (may not exist yet)."""
         self.validate_date(date)
         sanitized = self.sanitize_speaker_name(speaker_name)
-        path = (self.base_dir / sanitized / f"{date}.md").resolve()
-        # Final path traversal guard: ensure path is within base_dir
-        if not str(path).startswith(str(self.base_dir)):
+        # Both components are validated above, so the join cannot climb out of
+        # base_dir lexically; a symlinked speaker directory still could.
+        path = self.base_dir / sanitized / f"{date}.md"
+        # Final path traversal guard: ensure the real path is within base_dir
+        # (resolved once in __init__).
+        if not path.resolve().is_relative_to(self.base_dir):
             raise ValueError("Path traversal detected: resulting path escapes base directory")
         return path
 
@@ -85,12 +118,19 @@ class SummaryFileManager:
         - lowercase
         - replace spaces with underscores
         - remove non-alphanumeric chars (except underscores and hyphens)
+
+        Results are memoized; invalid names raise on every call.
         """
-        name = name.lower()
-        name = name.replace(" ", "_")
-        name = re.sub(r"[^a-z0-9_\-]", "", name)
-        # Prevent path traversal: strip leading dots and dashes
-        name = name.lstrip(".-")
-        if not name:
-            raise ValueError("Speaker name is empty after sanitization")
-        return name
+        return _sanitize_speaker_name(name)
+
+
+@lru_cache(maxsize=1024)
+def _sanitize_speaker_name(name: str) -> str:
+    name = name.lower()
+    name = name.replace(" ", "_")
+    name = _UNSAFE_NAME_CHARS.sub("", name)
+    # Prevent path traversal: strip leading dots and dashes
+    name = name.lstrip(".-")
+    if not name:
+        raise ValueError("Speaker name is empty after sanitization")
+    return name
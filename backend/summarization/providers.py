@@ -7,15 +7,8 @@ structured meeting summaries from diarized transcripts.
 from __future__ import annotations
 
 import json
-import urllib.request
 from dataclasses import dataclass
-
-try:
-    from enum import StrEnum
-except ImportError:
-    from enum import Enum as _Enum
-
-    StrEnum = _Enum("StrEnum", {}, type=str)
+from enum import StrEnum
 
 
 class LLMProvider(StrEnum):
@@ -56,7 +49,7 @@ Rules:
 """
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SummarizationRequest:
     """Request to generate a meeting summary.
 
@@ -73,7 +66,7 @@ class SummarizationRequest:
     api_key: str | None = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SummarizationResult:
     """Generated meeting summary.
 
@@ -226,6 +219,10 @@ class SummarizationService:
 
     def _summarize_ollama(self, request: SummarizationRequest) -> SummarizationResult:
         """Call local Ollama instance for summarization."""
+        # Deferred like the SDK imports above: urllib.request pulls in http.client
+        # and email, which dominate this module's import time otherwise.
+        import urllib.request
+
         url = "http://localhost:11434/api/generate"
         prompt = f"{SUMMARY_SYSTEM_PROMPT}\n\nSummarize this transcript:\n\n{request.transcript}"
         payload = json.dumps(
@@ -5,6 +5,7 @@ from __future__ import annotations
 import pytest
 
 from db.database import DatabaseManager
+from summarization.providers import SummarizationRequest, SummarizationService
 
 
 @pytest.fixture
@@ -14,3 +15,25 @@ def in_memory_db() -> DatabaseManager:
     db.initialize()
     yield db  # type: ignore[misc]
     db.close()
+
+
+@pytest.fixture
+def summarization_request(request: pytest.FixtureRequest) -> SummarizationRequest:
+    """Build a SummarizationRequest from an indirectly parametrized provider case.
+
+    See ``tests.provider_cases`` for the tables to parametrize with.
+    """
+    provider, model, api_key = request.param
+    return SummarizationRequest(
+        transcript="Alice: Hello.", provider=provider, model=model, api_key=api_key
+    )
+
+
+@pytest.fixture(scope="session")
+def summarization_service() -> SummarizationService:
+    """Provide one stateless SummarizationService shared across the session.
+
+    Tests that stub its provider methods must use monkeypatch so the originals
+    are restored for later tests.
+    """
+    return SummarizationService()
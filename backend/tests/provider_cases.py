@@ -0,0 +1,17 @@
+"""Parametrize tables of LLM provider configurations shared by the summarization tests."""
+
+from __future__ import annotations
+
+import pytest
+
+from summarization.providers import LLMProvider
+
+# (provider, model, api_key) for each supported LLM provider. Use with
+# ``indirect=["summarization_request"]`` to get a ready-built request.
+PROVIDER_CASES = [
+    pytest.param((LLMProvider.CLAUDE, "claude-sonnet-4-5-20250929", "sk-test"), id="claude"),
+    pytest.param((LLMProvider.OPENAI, "gpt-4o", "sk-test"), id="openai"),
+    pytest.param((LLMProvider.GEMINI, "gemini-pro", "test-key"), id="gemini"),
+    pytest.param((LLMProvider.OLLAMA, "llama3", None), id="ollama"),
+]
+HOSTED_PROVIDER_CASES = [case for case in PROVIDER_CASES if case.id != "ollama"]
@@ -9,6 +9,8 @@ save_settings, load_settings.
 from __future__ import annotations
 
 import base64
+import threading
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -170,6 +172,32 @@ class TestHandleTranscribeChunkWired:
 
         assert resp.data["is_partial"] is True
 
+    def test_concurrent_calls_share_one_engine(self) -> None:
+        """Verify simultaneous first requests load a single engine between them."""
+        from ipc.handlers import handle_transcribe_chunk
+
+        mock_engine_cls = MagicMock()
+        mock_engine_inst = MagicMock()
+        mock_engine_inst.load_model.side_effect = lambda: time.sleep(0.05)
+        mock_engine_inst.transcribe.return_value = []
+        mock_engine_cls.return_value = mock_engine_inst
+
+        msg = IPCMessage(
+            type=MessageType.TRANSCRIBE_CHUNK,
+            payload={"audio_base64": base64.b64encode(b"\x00" * 100).decode()},
+        )
+        with patch("transcription.engine.TranscriptionEngine", mock_engine_cls):
+            threads = [
+                threading.Thread(target=handle_transcribe_chunk, args=(msg,)) for _ in range(4)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        mock_engine_cls.assert_called_once()
+        assert mock_engine_inst.transcribe.call_count == 4
+
 
 # ===========================================================================
 # 2. handle_diarize — embedding extraction
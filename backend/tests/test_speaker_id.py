@@ -6,6 +6,7 @@ import random
 import struct
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
 from speaker_id.identifier import SpeakerIdentifier, SpeakerMatch
@@ -150,8 +151,7 @@ class TestSerialization:
         original = [0.1, 0.2, 0.3, -0.5, 1.0]
         serialized = SpeakerIdentifier.serialize_embedding(original)
         restored = SpeakerIdentifier.deserialize_embedding(serialized)
-        for orig, rest in zip(original, restored):
-            assert rest == pytest.approx(orig, abs=1e-6)
+        np.testing.assert_allclose(restored, original, rtol=0, atol=1e-6)
 
     def test_serialize_produces_correct_byte_length(self) -> None:
         """Each float32 should produce exactly 4 bytes."""
@@ -172,8 +172,7 @@ class TestSerialization:
         assert len(serialized) == 256 * 4
         restored = SpeakerIdentifier.deserialize_embedding(serialized)
         assert len(restored) == 256
-        for orig, rest in zip(original, restored):
-            assert rest == pytest.approx(orig, abs=1e-6)
+        np.testing.assert_allclose(restored, original, rtol=0, atol=1e-6)
 
 
 class TestIdentifyFromDb:
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -35,6 +37,41 @@ class TestSaveSummary:
         content = (tmp_path / "alice" / "2026-02-01.md").read_text()
         assert content == "Updated version."
 
+    def test_save_summary_leaves_no_temp_file_behind(self, tmp_path: Path) -> None:
+        """Verify that the atomic write cleans up its temp file."""
+        manager = SummaryFileManager(tmp_path)
+        manager.save_summary("alice", "2026-02-01", "First version.")
+        manager.save_summary("alice", "2026-02-01", "Updated version.")
+        assert sorted(p.name for p in (tmp_path / "alice").iterdir()) == ["2026-02-01.md"]
+
+    def test_save_summary_uses_a_distinct_temp_file_per_save(self, tmp_path: Path) -> None:
+        """Verify each save writes through its own temp file, so concurrent saves cannot collide."""
+        manager = SummaryFileManager(tmp_path)
+        replaced: list[str] = []
+        real_replace = os.replace
+
+        def record_replace(src: str, dst: Path) -> None:
+            replaced.append(os.path.basename(src))
+            real_replace(src, dst)
+
+        with patch("summaries.file_manager.os.replace", side_effect=record_replace):
+            manager.save_summary("Alice", "2026-02-01", "first")
+            manager.save_summary("Alice", "2026-02-01", "second")
+
+        assert len(set(replaced)) == 2
+        assert manager.get_summary("Alice", "2026-02-01") == "second"
+
+    def test_save_summary_removes_temp_file_when_write_fails(self, tmp_path: Path) -> None:
+        """Verify a failed save leaves neither a temp file nor a partial summary."""
+        manager = SummaryFileManager(tmp_path)
+        with (
+            patch("summaries.file_manager.os.replace", side_effect=OSError("disk full")),
+            pytest.raises(OSError, match="disk full"),
+        ):
+            manager.save_summary("Alice", "2026-02-01", "content")
+
+        assert list((tmp_path / "alice").iterdir()) == []
+
 
 class TestGetSummary:
     """Tests for reading summary files."""
@@ -145,6 +182,18 @@ class TestSecurityValidation:
         with pytest.raises(ValueError, match="Invalid date format"):
             manager.save_summary("alice", "../../etc/passwd", "malicious")
 
+    def test_symlinked_speaker_directory_escaping_base_rejected(self, tmp_path: Path) -> None:
+        """Verify a speaker directory symlinked outside base_dir cannot be written through."""
+        base = tmp_path / "summaries"
+        outside = tmp_path / "outside"
+        base.mkdir()
+        outside.mkdir()
+        (base / "alice").symlink_to(outside, target_is_directory=True)
+        manager = SummaryFileManager(base)
+        with pytest.raises(ValueError, match="Path traversal"):
+            manager.save_summary("alice", "2026-02-08", "leaked")
+        assert list(outside.iterdir()) == []
+
     def test_date_with_slashes_rejected(self, tmp_path: Path) -> None:
         """Verify that date containing slashes is rejected."""
         manager = SummaryFileManager(tmp_path)
@@ -161,6 +210,18 @@ class TestSecurityValidation:
         # Valid date should not raise
         manager.get_summary_path("alice", "2026-02-08")
 
+    def test_date_with_trailing_newline_rejected(self, tmp_path: Path) -> None:
+        """Verify that a trailing newline does not slip past the format check."""
+        manager = SummaryFileManager(tmp_path)
+        with pytest.raises(ValueError, match="Invalid date format"):
+            manager.get_summary_path("alice", "2026-02-08\n")
+
+    def test_date_must_be_a_real_calendar_date(self, tmp_path: Path) -> None:
+        """Verify that well-formed but impossible dates are rejected."""
+        manager = SummaryFileManager(tmp_path)
+        with pytest.raises(ValueError, match="Invalid date format"):
+            manager.get_summary_path("alice", "2026-13-45")
+
     def test_empty_speaker_name_raises_valueerror(self) -> None:
         """Verify that an empty speaker name raises ValueError."""
         with pytest.raises(ValueError, match="empty after sanitization"):
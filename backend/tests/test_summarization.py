@@ -2,11 +2,17 @@
 
 from __future__ import annotations
 
+import dataclasses
+import importlib
+import sys
 import types
-from unittest.mock import MagicMock, patch
+from collections.abc import Callable, Iterator
+from unittest.mock import MagicMock, create_autospec, patch
 
 import pytest
 
+from ipc.handlers import handle_summarize
+from ipc.protocol import IPCMessage, MessageType
 from summarization.providers import (
     SUMMARY_SYSTEM_PROMPT,
     LLMProvider,
@@ -14,262 +20,383 @@ from summarization.providers import (
     SummarizationResult,
     SummarizationService,
 )
+from tests.provider_cases import HOSTED_PROVIDER_CASES, PROVIDER_CASES
 
+# ---------------------------------------------------------------------------
+# Per-provider expectations
+# ---------------------------------------------------------------------------
 
-class TestSummarizationService:
-    """Tests for SummarizationService provider routing."""
+# Returned by the stubbed provider methods in TestSummarizeRouting (frozen, so
+# safe to share across tests).
+_OK_RESULTS = {
+    provider: SummarizationResult(markdown="test", provider=provider, model="test", token_count=0)
+    for provider in LLMProvider
+}
 
-    @pytest.fixture(autouse=True)
-    def _mock_providers(self) -> None:  # type: ignore[no-untyped-def]
-        """Mock provider internals so tests work without SDKs installed."""
-        mock_anthropic = MagicMock()
-        mock_response = MagicMock()
-        mock_response.content = [MagicMock(text="")]
-        mock_response.usage.input_tokens = 0
-        mock_response.usage.output_tokens = 0
-        mock_anthropic.Anthropic.return_value.messages.create.return_value = mock_response
-
-        mock_openai = MagicMock()
-        mock_oai_response = MagicMock()
-        mock_oai_response.choices = [MagicMock(message=MagicMock(content=""))]
-        mock_oai_response.usage.prompt_tokens = 0
-        mock_oai_response.usage.completion_tokens = 0
-        mock_openai.OpenAI.return_value.chat.completions.create.return_value = mock_oai_response
-
-        with (
-            patch.dict("sys.modules", {"anthropic": mock_anthropic, "openai": mock_openai}),
-            patch("summarization.providers.urllib.request.urlopen") as mock_urlopen,
-        ):
-            mock_http = MagicMock()
-            mock_http.read.return_value = (
-                b'{"response": "", "prompt_eval_count": 0, "eval_count": 0}'
-            )
-            mock_http.__enter__ = lambda s: s
-            mock_http.__exit__ = MagicMock(return_value=False)
-            mock_urlopen.return_value = mock_http
-            yield
+# sys.modules entries to hide, and the expected error, for each hosted provider's SDK.
+_SDK_MODULES: dict[LLMProvider, tuple[tuple[str, ...], str]] = {
+    LLMProvider.CLAUDE: (("anthropic",), "anthropic is not installed"),
+    LLMProvider.OPENAI: (("openai",), "openai is not installed"),
+    LLMProvider.GEMINI: (("google", "google.generativeai"), "google-generativeai is not installed"),
+}
 
-    def test_summarize_claude_returns_result(self) -> None:
-        """Verify that Claude provider returns a SummarizationResult."""
-        service = SummarizationService()
-        request = SummarizationRequest(
-            transcript="Alice: Hello. Bob: Hi.",
-            provider=LLMProvider.CLAUDE,
-            model="claude-sonnet-4-5-20250929",
-            api_key="sk-test",
-        )
-        result = service.summarize(request)
-        assert isinstance(result, SummarizationResult)
-        assert result.provider == LLMProvider.CLAUDE
+# ---------------------------------------------------------------------------
+# SDK surfaces the module mocks are autospecced from, down to the methods the
+# providers call, so a typo in an attribute or keyword argument raises instead
+# of silently creating a child mock
+# ---------------------------------------------------------------------------
 
-    def test_summarize_openai_returns_result(self) -> None:
-        """Verify that OpenAI provider returns a SummarizationResult."""
-        service = SummarizationService()
-        request = SummarizationRequest(
-            transcript="Alice: Hello.",
-            provider=LLMProvider.OPENAI,
-            model="gpt-4o",
-            api_key="sk-test",
-        )
-        result = service.summarize(request)
-        assert result.provider == LLMProvider.OPENAI
 
-    def test_summarize_ollama_returns_result(self) -> None:
-        """Verify that Ollama provider returns a SummarizationResult (no API key needed)."""
-        service = SummarizationService()
-        request = SummarizationRequest(
-            transcript="Alice: Hello.",
-            provider=LLMProvider.OLLAMA,
-            model="llama3",
-        )
-        result = service.summarize(request)
-        assert result.provider == LLMProvider.OLLAMA
+class _AnthropicMessages:
+    def create(
+        self, *, model: str, max_tokens: int, system: str, messages: list[dict[str, str]]
+    ) -> object: ...
 
 
-class TestLLMProvider:
-    """Tests for the LLMProvider enum."""
+class _AnthropicSDK:
+    """The part of the ``anthropic`` module that _summarize_claude uses."""
 
-    def test_provider_values(self) -> None:
-        """Verify that provider enum values are the expected strings."""
-        assert LLMProvider.CLAUDE == "claude"
-        assert LLMProvider.OPENAI == "openai"
-        assert LLMProvider.OLLAMA == "ollama"
+    class Anthropic:
+        messages = _AnthropicMessages()
 
+        def __init__(self, api_key: str) -> None: ...
 
-class TestSummarizationRequest:
-    """Tests for the SummarizationRequest data class."""
 
-    def test_api_key_defaults_to_none(self) -> None:
-        """Verify that api_key is optional and defaults to None."""
-        req = SummarizationRequest(
-            transcript="test",
-            provider=LLMProvider.OLLAMA,
-            model="llama3",
-        )
-        assert req.api_key is None
+class _OpenAICompletions:
+    def create(self, *, model: str, messages: list[dict[str, str]]) -> object: ...
 
 
-class TestLLMProviderEnum:
-    """Tests for the LLMProvider enum completeness."""
+class _OpenAIChat:
+    completions = _OpenAICompletions()
 
-    def test_provider_has_all_expected_values(self) -> None:
-        """Verify that LLMProvider has claude, openai, gemini, and ollama."""
-        assert LLMProvider.CLAUDE == "claude"
-        assert LLMProvider.OPENAI == "openai"
-        assert LLMProvider.GEMINI == "gemini"
-        assert LLMProvider.OLLAMA == "ollama"
 
-    def test_provider_enum_has_exactly_four_members(self) -> None:
-        """Verify that LLMProvider has exactly 4 members."""
-        assert len(LLMProvider) == 4
+class _OpenAISDK:
+    """The part of the ``openai`` module that _summarize_openai uses."""
 
+    class OpenAI:
+        chat = _OpenAIChat()
 
-class TestSummarizationResultFields:
-    """Tests for SummarizationResult dataclass fields."""
+        def __init__(self, api_key: str) -> None: ...
 
-    def test_result_contains_all_expected_fields(self) -> None:
-        """Verify SummarizationResult has markdown, provider, model, and token_count."""
-        result = SummarizationResult(
-            markdown="# Meeting Summary",
-            provider=LLMProvider.CLAUDE,
-            model="claude-sonnet-4-5-20250929",
-            token_count=150,
-        )
-        assert result.markdown == "# Meeting Summary"
-        assert result.provider == LLMProvider.CLAUDE
-        assert result.model == "claude-sonnet-4-5-20250929"
-        assert result.token_count == 150
 
+class _GenAISDK:
+    """The part of ``google.generativeai`` that _summarize_gemini uses."""
 
-class TestSummarySystemPrompt:
-    """Tests for the SUMMARY_SYSTEM_PROMPT constant."""
+    @staticmethod
+    def configure(api_key: str) -> None: ...
 
-    def test_prompt_contains_meeting_header(self) -> None:
-        """Verify SUMMARY_SYSTEM_PROMPT instructs to produce a Meeting header."""
-        assert "# Meeting:" in SUMMARY_SYSTEM_PROMPT
+    class GenerativeModel:
+        def __init__(self, model_name: str) -> None: ...
 
-    def test_prompt_contains_participants_section(self) -> None:
-        """Verify SUMMARY_SYSTEM_PROMPT contains Participants section."""
-        assert "## Participants" in SUMMARY_SYSTEM_PROMPT
+        def generate_content(self, contents: str) -> object: ...
 
-    def test_prompt_contains_summary_section(self) -> None:
-        """Verify SUMMARY_SYSTEM_PROMPT contains Summary section."""
-        assert "## Summary" in SUMMARY_SYSTEM_PROMPT
 
-    def test_prompt_contains_key_discussion_points_section(self) -> None:
-        """Verify SUMMARY_SYSTEM_PROMPT contains Key Discussion Points section."""
-        assert "## Key Discussion Points" in SUMMARY_SYSTEM_PROMPT
+# ---------------------------------------------------------------------------
+# Provider SDK / HTTP mocks shared by TestSummarizationService
+# ---------------------------------------------------------------------------
 
-    def test_prompt_contains_action_items_section(self) -> None:
-        """Verify SUMMARY_SYSTEM_PROMPT contains Action Items section."""
-        assert "## Action Items" in SUMMARY_SYSTEM_PROMPT
+_MOCK_ANTHROPIC_CLS = create_autospec(_AnthropicSDK.Anthropic, spec_set=True)
+_MOCK_ANTHROPIC_CLS.return_value.messages.create.return_value = types.SimpleNamespace(
+    content=[types.SimpleNamespace(text="")],
+    usage=types.SimpleNamespace(input_tokens=0, output_tokens=0),
+)
 
-    def test_prompt_contains_notes_section(self) -> None:
-        """Verify SUMMARY_SYSTEM_PROMPT contains Notes section."""
-        assert "## Notes" in SUMMARY_SYSTEM_PROMPT
+_MOCK_OPENAI_CLS = create_autospec(_OpenAISDK.OpenAI, spec_set=True)
+_MOCK_OPENAI_CLS.return_value.chat.completions.create.return_value = types.SimpleNamespace(
+    choices=[types.SimpleNamespace(message=types.SimpleNamespace(content=""))],
+    usage=types.SimpleNamespace(prompt_tokens=0, completion_tokens=0),
+)
 
+_MOCK_GENAI_MODEL_CLS = create_autospec(_GenAISDK.GenerativeModel, spec_set=True)
+_MOCK_GENAI_MODEL_CLS.return_value.generate_content.return_value = types.SimpleNamespace(
+    text="",
+    usage_metadata=types.SimpleNamespace(prompt_token_count=0, candidates_token_count=0),
+)
 
-class TestSummarizeRouting:
-    """Tests for SummarizationService.summarize routing to correct provider method."""
+_OLLAMA_EMPTY_BODY = b'{"response": "", "prompt_eval_count": 0, "eval_count": 0}'
+_OLLAMA_SUMMARY_BODY = (
+    b'{"response": "# Meeting Summary", "prompt_eval_count": 70, "eval_count": 30}'
+)
 
-    def test_summarize_routes_to_claude(self) -> None:
-        """Verify summarize calls _summarize_claude for Claude provider."""
-        service = SummarizationService()
-        request = SummarizationRequest(
-            transcript="Alice: Hello.",
-            provider=LLMProvider.CLAUDE,
-            model="claude-sonnet-4-5-20250929",
-            api_key="sk-test",
-        )
-        with patch.object(service, "_summarize_claude") as mock_claude:
-            mock_claude.return_value = SummarizationResult(
-                markdown="test", provider=LLMProvider.CLAUDE, model="test", token_count=0
-            )
-            service.summarize(request)
-            mock_claude.assert_called_once_with(request)
 
-    def test_summarize_routes_to_openai(self) -> None:
-        """Verify summarize calls _summarize_openai for OpenAI provider."""
-        service = SummarizationService()
-        request = SummarizationRequest(
-            transcript="Alice: Hello.",
-            provider=LLMProvider.OPENAI,
-            model="gpt-4o",
-            api_key="sk-test",
-        )
-        with patch.object(service, "_summarize_openai") as mock_openai:
-            mock_openai.return_value = SummarizationResult(
-                markdown="test", provider=LLMProvider.OPENAI, model="test", token_count=0
-            )
-            service.summarize(request)
-            mock_openai.assert_called_once_with(request)
+class _FakeHTTP:
+    """Minimal stand-in for the response context manager returned by urlopen."""
+
+    def __init__(self, body: bytes) -> None:
+        self._body = body
+
+    def read(self) -> bytes:
+        return self._body
+
+    def __enter__(self) -> _FakeHTTP:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        pass
+
+
+_LLM_SDK_MODULES = ("anthropic", "openai", "google", "google.generativeai")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def llm_sdk_stubs() -> Iterator[dict[str, types.ModuleType]]:
+    """Provide the optional LLM SDK modules, stubbing only those not installed.
+
+    Tests rebind attributes on these modules (e.g. ``Anthropic``) via monkeypatch
+    instead of swapping ``sys.modules`` entries per test. Stubs are removed when
+    this module's tests finish, so other test modules see the real environment.
+    """
+    modules: dict[str, types.ModuleType] = {}
+    with pytest.MonkeyPatch.context() as mp:
+        for name in _LLM_SDK_MODULES:
+            try:
+                modules[name] = importlib.import_module(name)
+            except ImportError:
+                stub = types.ModuleType(name)
+                if "." not in name:
+                    # A package, so imports of other submodules (e.g. google.protobuf)
+                    # fail with ImportError rather than "is not a package".
+                    stub.__path__ = []
+                mp.setitem(sys.modules, name, stub)
+                modules[name] = stub
+        mp.setattr(modules["google"], "generativeai", modules["google.generativeai"], raising=False)
+        yield modules
+
+
+# (module mock, client mock, canned response) installed on the SDK stub module.
+SDKFake = tuple[MagicMock, MagicMock, types.SimpleNamespace]
+
+
+@pytest.fixture
+def anthropic_fake(
+    llm_sdk_stubs: dict[str, types.ModuleType], monkeypatch: pytest.MonkeyPatch
+) -> SDKFake:
+    """Install a fake Anthropic client whose messages.create returns a canned summary."""
+    module = create_autospec(_AnthropicSDK, spec_set=True)
+    client = module.Anthropic.return_value
+    resp = types.SimpleNamespace(
+        content=[types.SimpleNamespace(text="# Meeting Summary")],
+        usage=types.SimpleNamespace(input_tokens=100, output_tokens=50),
+    )
+    client.messages.create.return_value = resp
+    monkeypatch.setattr(llm_sdk_stubs["anthropic"], "Anthropic", module.Anthropic, raising=False)
+    return module, client, resp
+
+
+@pytest.fixture
+def openai_fake(
+    llm_sdk_stubs: dict[str, types.ModuleType], monkeypatch: pytest.MonkeyPatch
+) -> SDKFake:
+    """Install a fake OpenAI client whose chat.completions.create returns a canned summary."""
+    module = create_autospec(_OpenAISDK, spec_set=True)
+    client = module.OpenAI.return_value
+    resp = types.SimpleNamespace(
+        choices=[types.SimpleNamespace(message=types.SimpleNamespace(content="# Meeting Summary"))],
+        usage=types.SimpleNamespace(prompt_tokens=80, completion_tokens=40),
+    )
+    client.chat.completions.create.return_value = resp
+    monkeypatch.setattr(llm_sdk_stubs["openai"], "OpenAI", module.OpenAI, raising=False)
+    return module, client, resp
+
+
+class TestSDKMockSpecs:
+    """Tests that the SDK mocks reject calls the real SDKs would not accept."""
+
+    @pytest.mark.parametrize(
+        "misuse",
+        [
+            pytest.param(lambda: _MOCK_ANTHROPIC_CLS(api_kye="k"), id="anthropic-ctor-kwarg"),
+            pytest.param(lambda: _MOCK_ANTHROPIC_CLS.return_value.mesages, id="anthropic-attr"),
+            pytest.param(
+                lambda: _MOCK_ANTHROPIC_CLS.return_value.messages.create(
+                    model="m", max_tokens=1, system="s", mesages=[]
+                ),
+                id="anthropic-create-kwarg",
+            ),
+            pytest.param(lambda: _MOCK_OPENAI_CLS.return_value.chat.completion, id="openai-attr"),
+            pytest.param(
+                lambda: _MOCK_OPENAI_CLS.return_value.chat.completions.create(
+                    model="m", prompt="p"
+                ),
+                id="openai-create-kwarg",
+            ),
+            pytest.param(lambda: _MOCK_GENAI_MODEL_CLS("m").generate("p"), id="gemini-attr"),
+        ],
+    )
+    def test_nested_typos_raise(self, misuse: Callable[[], object]) -> None:
+        """Verify misspelled nested attributes and arguments raise instead of passing."""
+        with pytest.raises((AttributeError, TypeError)):
+            misuse()
 
-    def test_summarize_routes_to_gemini(self) -> None:
-        """Verify summarize calls _summarize_gemini for Gemini provider."""
-        service = SummarizationService()
-        request = SummarizationRequest(
-            transcript="Alice: Hello.",
-            provider=LLMProvider.GEMINI,
-            model="gemini-pro",
-            api_key="test-key",
-        )
-        with patch.object(service, "_summarize_gemini") as mock_gemini:
-            mock_gemini.return_value = SummarizationResult(
-                markdown="test", provider=LLMProvider.GEMINI, model="test", token_count=0
-            )
-            service.summarize(request)
-            mock_gemini.assert_called_once_with(request)
 
-    def test_summarize_routes_to_ollama(self) -> None:
-        """Verify summarize calls _summarize_ollama for Ollama provider."""
-        service = SummarizationService()
-        request = SummarizationRequest(
-            transcript="Alice: Hello.",
-            provider=LLMProvider.OLLAMA,
-            model="llama3",
-        )
-        with patch.object(service, "_summarize_ollama") as mock_ollama:
-            mock_ollama.return_value = SummarizationResult(
-                markdown="test", provider=LLMProvider.OLLAMA, model="test", token_count=0
+class TestSummarizationService:
+    """Tests for SummarizationService provider routing."""
+
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def _mock_providers(cls, llm_sdk_stubs: dict[str, types.ModuleType]) -> Iterator[None]:
+        """Mock provider internals once per class so tests work without SDKs installed."""
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(llm_sdk_stubs["anthropic"], "Anthropic", _MOCK_ANTHROPIC_CLS, raising=False)
+            mp.setattr(llm_sdk_stubs["openai"], "OpenAI", _MOCK_OPENAI_CLS, raising=False)
+            genai = llm_sdk_stubs["google.generativeai"]
+            mp.setattr(
+                genai,
+                "configure",
+                create_autospec(_GenAISDK.configure, spec_set=True),
+                raising=False,
             )
-            service.summarize(request)
-            mock_ollama.assert_called_once_with(request)
+            mp.setattr(genai, "GenerativeModel", _MOCK_GENAI_MODEL_CLS, raising=False)
+            mp.setattr(
+                "urllib.request.urlopen", MagicMock(return_value=_FakeHTTP(_OLLAMA_EMPTY_BODY))
+            )
+            yield
 
-    def test_summarize_raises_valueerror_for_unsupported_provider(self) -> None:
+    @pytest.mark.parametrize("summarization_request", PROVIDER_CASES, indirect=True)
+    def test_summarize_returns_result(
+        self,
+        summarization_service: SummarizationService,
+        summarization_request: SummarizationRequest,
+    ) -> None:
+        """Verify each provider returns a SummarizationResult tagged with that provider."""
+        result = summarization_service.summarize(summarization_request)
+        assert isinstance(result, SummarizationResult)
+        assert result.provider == summarization_request.provider
+
+
+# ---------------------------------------------------------------------------
+# Data types and prompt
+# ---------------------------------------------------------------------------
+
+
+def test_provider_enum_complete() -> None:
+    """Verify LLMProvider has exactly the claude, openai, gemini, and ollama values."""
+    # StrEnum members compare equal to their values, so this also checks str equality.
+    assert set(LLMProvider) == {"claude", "openai", "gemini", "ollama"}
+
+
+def test_api_key_defaults_to_none() -> None:
+    """Verify that api_key is optional and defaults to None."""
+    req = SummarizationRequest(
+        transcript="test",
+        provider=LLMProvider.OLLAMA,
+        model="llama3",
+    )
+    assert req.api_key is None
+
+
+def test_result_contains_all_expected_fields() -> None:
+    """Verify SummarizationResult has markdown, provider, model, and token_count."""
+    result = SummarizationResult(
+        markdown="# Meeting Summary",
+        provider=LLMProvider.CLAUDE,
+        model="claude-sonnet-4-5-20250929",
+        token_count=150,
+    )
+    assert result.markdown == "# Meeting Summary"
+    assert result.provider == LLMProvider.CLAUDE
+    assert result.model == "claude-sonnet-4-5-20250929"
+    assert result.token_count == 150
+
+
+@pytest.mark.parametrize(
+    "needle",
+    [
+        "# Meeting:",
+        "## Participants",
+        "## Summary",
+        "## Key Discussion Points",
+        "## Action Items",
+        "## Notes",
+    ],
+)
+def test_prompt_contains_section(needle: str) -> None:
+    """Verify SUMMARY_SYSTEM_PROMPT instructs the model to produce each section."""
+    assert needle in SUMMARY_SYSTEM_PROMPT
+
+
+class TestSummarizeRouting:
+    """Tests for SummarizationService.summarize routing to correct provider method."""
+
+    @pytest.mark.parametrize("summarization_request", PROVIDER_CASES, indirect=True)
+    def test_summarize_routes_to_provider_method(
+        self,
+        summarization_service: SummarizationService,
+        monkeypatch: pytest.MonkeyPatch,
+        summarization_request: SummarizationRequest,
+    ) -> None:
+        """Verify summarize calls the matching _summarize_<provider> method."""
+        req = summarization_request
+        result = _OK_RESULTS[req.provider]
+        calls: list[SummarizationRequest] = []
+
+        def fake(request: SummarizationRequest) -> SummarizationResult:
+            calls.append(request)
+            return result
+
+        monkeypatch.setattr(summarization_service, f"_summarize_{req.provider}", fake)
+        assert summarization_service.summarize(req) is result
+        assert calls == [req]
+
+    def test_summarize_raises_valueerror_for_unsupported_provider(
+        self, summarization_service: SummarizationService
+    ) -> None:
         """Verify summarize raises ValueError for an unrecognized provider."""
-        service = SummarizationService()
         request = SummarizationRequest(
             transcript="Alice: Hello.",
             provider="unsupported",  # type: ignore[arg-type]
             model="some-model",
         )
         with pytest.raises(ValueError, match="Unsupported provider"):
-            service.summarize(request)
+            summarization_service.summarize(request)
+
+
+class TestProviderPreconditions:
+    """Tests for the API-key and SDK checks shared by the hosted providers."""
+
+    @pytest.mark.parametrize("summarization_request", HOSTED_PROVIDER_CASES, indirect=True)
+    def test_raises_valueerror_when_api_key_missing(
+        self,
+        summarization_service: SummarizationService,
+        summarization_request: SummarizationRequest,
+    ) -> None:
+        """Verify each hosted provider raises ValueError when api_key is None."""
+        provider = summarization_request.provider
+        request = dataclasses.replace(summarization_request, api_key=None)
+        with pytest.raises(ValueError, match=f"API key required for {provider}"):
+            getattr(summarization_service, f"_summarize_{provider}")(request)
+
+    @pytest.mark.parametrize("summarization_request", HOSTED_PROVIDER_CASES, indirect=True)
+    def test_raises_runtimeerror_when_sdk_not_installed(
+        self,
+        summarization_service: SummarizationService,
+        monkeypatch: pytest.MonkeyPatch,
+        summarization_request: SummarizationRequest,
+    ) -> None:
+        """Verify each hosted provider raises RuntimeError when its SDK is missing."""
+        provider = summarization_request.provider
+        modules, error = _SDK_MODULES[provider]
+        for name in modules:
+            monkeypatch.setitem(sys.modules, name, None)
+        with pytest.raises(RuntimeError, match=error):
+            getattr(summarization_service, f"_summarize_{provider}")(summarization_request)
 
 
 class TestSummarizeClaudeProvider:
     """Tests for _summarize_claude method."""
 
-    def test_claude_calls_anthropic_messages_create(self) -> None:
+    def test_claude_calls_anthropic_messages_create(
+        self, summarization_service: SummarizationService, anthropic_fake: SDKFake
+    ) -> None:
         """Verify _summarize_claude calls Anthropic messages.create with correct params."""
-        mock_anthropic_module = MagicMock()
-        mock_client = MagicMock()
-        mock_anthropic_module.Anthropic.return_value = mock_client
-        mock_response = MagicMock()
-        mock_response.content = [MagicMock(text="# Meeting Summary")]
-        mock_response.usage.input_tokens = 100
-        mock_response.usage.output_tokens = 50
-        mock_client.messages.create.return_value = mock_response
-
-        with patch.dict("sys.modules", {"anthropic": mock_anthropic_module}):
-            service = SummarizationService()
-            request = SummarizationRequest(
-                transcript="Alice: Hello. Bob: Hi.",
-                provider=LLMProvider.CLAUDE,
-                model="claude-sonnet-4-5-20250929",
-                api_key="sk-test-key",
-            )
-            result = service._summarize_claude(request)
+        mock_anthropic_module, mock_client, _ = anthropic_fake
+        request = SummarizationRequest(
+            transcript="Alice: Hello. Bob: Hi.",
+            provider=LLMProvider.CLAUDE,
+            model="claude-sonnet-4-5-20250929",
+            api_key="sk-test-key",
+        )
+        result = summarization_service._summarize_claude(request)
 
         mock_anthropic_module.Anthropic.assert_called_once_with(api_key="sk-test-key")
         mock_client.messages.create.assert_called_once()
@@ -282,73 +409,38 @@ class TestSummarizeClaudeProvider:
         assert result.model == "claude-sonnet-4-5-20250929"
         assert result.token_count == 150
 
-    def test_claude_raises_valueerror_when_api_key_missing(self) -> None:
-        """Verify _summarize_claude raises ValueError when api_key is None."""
-        service = SummarizationService()
+    def test_claude_raises_connectionerror_on_api_failure(
+        self, summarization_service: SummarizationService, anthropic_fake: SDKFake
+    ) -> None:
+        """Verify _summarize_claude raises ConnectionError when API call fails."""
+        _, mock_client, _ = anthropic_fake
+        mock_client.messages.create.side_effect = Exception("network timeout")
+
         request = SummarizationRequest(
             transcript="Alice: Hello.",
             provider=LLMProvider.CLAUDE,
             model="claude-sonnet-4-5-20250929",
-            api_key=None,
+            api_key="sk-test-key",
         )
-        with pytest.raises(ValueError, match="API key required for claude"):
-            service._summarize_claude(request)
-
-    def test_claude_raises_runtimeerror_when_sdk_not_installed(self) -> None:
-        """Verify _summarize_claude raises RuntimeError when anthropic is not installed."""
-        with patch.dict("sys.modules", {"anthropic": None}):
-            service = SummarizationService()
-            request = SummarizationRequest(
-                transcript="Alice: Hello.",
-                provider=LLMProvider.CLAUDE,
-                model="claude-sonnet-4-5-20250929",
-                api_key="sk-test-key",
-            )
-            with pytest.raises(RuntimeError, match="anthropic is not installed"):
-                service._summarize_claude(request)
-
-    def test_claude_raises_connectionerror_on_api_failure(self) -> None:
-        """Verify _summarize_claude raises ConnectionError when API call fails."""
-        mock_anthropic_module = MagicMock()
-        mock_client = MagicMock()
-        mock_anthropic_module.Anthropic.return_value = mock_client
-        mock_client.messages.create.side_effect = Exception("network timeout")
-
-        with patch.dict("sys.modules", {"anthropic": mock_anthropic_module}):
-            service = SummarizationService()
-            request = SummarizationRequest(
-                transcript="Alice: Hello.",
-                provider=LLMProvider.CLAUDE,
-                model="claude-sonnet-4-5-20250929",
-                api_key="sk-test-key",
-            )
-            with pytest.raises(ConnectionError, match="Failed to connect to claude"):
-                service._summarize_claude(request)
+        with pytest.raises(ConnectionError, match="Failed to connect to claude"):
+            summarization_service._summarize_claude(request)
 
 
 class TestSummarizeOpenAIProvider:
     """Tests for _summarize_openai method."""
 
-    def test_openai_calls_chat_completions_create(self) -> None:
+    def test_openai_calls_chat_completions_create(
+        self, summarization_service: SummarizationService, openai_fake: SDKFake
+    ) -> None:
         """Verify _summarize_openai calls OpenAI chat.completions.create correctly."""
-        mock_openai_module = MagicMock()
-        mock_client = MagicMock()
-        mock_openai_module.OpenAI.return_value = mock_client
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content="# Meeting Summary"))]
-        mock_response.usage.prompt_tokens = 80
-        mock_response.usage.completion_tokens = 40
-        mock_client.chat.completions.create.return_value = mock_response
-
-        with patch.dict("sys.modules", {"openai": mock_openai_module}):
-            service = SummarizationService()
-            request = SummarizationRequest(
-                transcript="Alice: Hello. Bob: Hi.",
-                provider=LLMProvider.OPENAI,
-                model="gpt-4o",
-                api_key="sk-test-key",
-            )
-            result = service._summarize_openai(request)
+        mock_openai_module, mock_client, _ = openai_fake
+        request = SummarizationRequest(
+            transcript="Alice: Hello. Bob: Hi.",
+            provider=LLMProvider.OPENAI,
+            model="gpt-4o",
+            api_key="sk-test-key",
+        )
+        result = summarization_service._summarize_openai(request)
 
         mock_openai_module.OpenAI.assert_called_once_with(api_key="sk-test-key")
         mock_client.chat.completions.create.assert_called_once()
@@ -364,61 +456,38 @@ class TestSummarizeOpenAIProvider:
         assert result.model == "gpt-4o"
         assert result.token_count == 120
 
-    def test_openai_raises_valueerror_when_api_key_missing(self) -> None:
-        """Verify _summarize_openai raises ValueError when api_key is None."""
-        service = SummarizationService()
-        request = SummarizationRequest(
-            transcript="test",
-            provider=LLMProvider.OPENAI,
-            model="gpt-4o",
-            api_key=None,
-        )
-        with pytest.raises(ValueError, match="API key required for openai"):
-            service._summarize_openai(request)
-
-    def test_openai_raises_runtimeerror_when_sdk_not_installed(self) -> None:
-        """Verify _summarize_openai raises RuntimeError when openai is not installed."""
-        with patch.dict("sys.modules", {"openai": None}):
-            service = SummarizationService()
-            request = SummarizationRequest(
-                transcript="test",
-                provider=LLMProvider.OPENAI,
-                model="gpt-4o",
-                api_key="sk-test",
-            )
-            with pytest.raises(RuntimeError, match="openai is not installed"):
-                service._summarize_openai(request)
-
 
 class TestSummarizeGeminiProvider:
     """Tests for _summarize_gemini method."""
 
-    def test_gemini_calls_generativeai_with_correct_params(self) -> None:
+    def test_gemini_calls_generativeai_with_correct_params(
+        self,
+        summarization_service: SummarizationService,
+        llm_sdk_stubs: dict[str, types.ModuleType],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
         """Verify _summarize_gemini uses google.generativeai with correct params."""
-        mock_genai_module = MagicMock()
-        mock_model = MagicMock()
+        mock_genai_module = create_autospec(_GenAISDK, spec_set=True)
+        mock_model = create_autospec(_GenAISDK.GenerativeModel, spec_set=True, instance=True)
         mock_genai_module.GenerativeModel.return_value = mock_model
-        mock_response = MagicMock()
-        mock_response.text = "# Meeting Summary"
-        mock_response.usage_metadata.prompt_token_count = 90
-        mock_response.usage_metadata.candidates_token_count = 60
+        mock_response = types.SimpleNamespace(
+            text="# Meeting Summary",
+            usage_metadata=types.SimpleNamespace(prompt_token_count=90, candidates_token_count=60),
+        )
         mock_model.generate_content.return_value = mock_response
+        genai_stub = llm_sdk_stubs["google.generativeai"]
+        monkeypatch.setattr(genai_stub, "configure", mock_genai_module.configure, raising=False)
+        monkeypatch.setattr(
+            genai_stub, "GenerativeModel", mock_genai_module.GenerativeModel, raising=False
+        )
 
-        mock_google = types.ModuleType("google")
-        mock_google.generativeai = mock_genai_module  # type: ignore[attr-defined]
-
-        with patch.dict(
-            "sys.modules",
-            {"google": mock_google, "google.generativeai": mock_genai_module},
-        ):
-            service = SummarizationService()
-            request = SummarizationRequest(
-                transcript="Alice: Hello. Bob: Hi.",
-                provider=LLMProvider.GEMINI,
-                model="gemini-pro",
-                api_key="test-api-key",
-            )
-            result = service._summarize_gemini(request)
+        request = SummarizationRequest(
+            transcript="Alice: Hello. Bob: Hi.",
+            provider=LLMProvider.GEMINI,
+            model="gemini-pro",
+            api_key="test-api-key",
+        )
+        result = summarization_service._summarize_gemini(request)
 
         mock_genai_module.configure.assert_called_once_with(api_key="test-api-key")
         mock_genai_module.GenerativeModel.assert_called_once_with("gemini-pro")
@@ -428,61 +497,23 @@ class TestSummarizeGeminiProvider:
         assert result.model == "gemini-pro"
         assert result.token_count == 150
 
-    def test_gemini_raises_valueerror_when_api_key_missing(self) -> None:
-        """Verify _summarize_gemini raises ValueError when api_key is None."""
-        service = SummarizationService()
-        request = SummarizationRequest(
-            transcript="test",
-            provider=LLMProvider.GEMINI,
-            model="gemini-pro",
-            api_key=None,
-        )
-        with pytest.raises(ValueError, match="API key required for gemini"):
-            service._summarize_gemini(request)
-
-    def test_gemini_raises_runtimeerror_when_sdk_not_installed(self) -> None:
-        """Verify _summarize_gemini raises RuntimeError when SDK is missing."""
-        with patch.dict("sys.modules", {"google": None, "google.generativeai": None}):
-            service = SummarizationService()
-            request = SummarizationRequest(
-                transcript="test",
-                provider=LLMProvider.GEMINI,
-                model="gemini-pro",
-                api_key="test-key",
-            )
-            with pytest.raises(RuntimeError, match="google-generativeai is not installed"):
-                service._summarize_gemini(request)
-
 
 class TestSummarizeOllamaProvider:
     """Tests for _summarize_ollama method."""
 
-    def test_ollama_makes_http_request_to_localhost(self) -> None:
+    def test_ollama_makes_http_request_to_localhost(
+        self, summarization_service: SummarizationService
+    ) -> None:
         """Verify _summarize_ollama sends POST to localhost:11434/api/generate."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "response": "# Meeting Summary",
-            "prompt_eval_count": 70,
-            "eval_count": 30,
-        }
-
-        with patch("summarization.providers.urllib.request.urlopen") as mock_urlopen:
-            mock_http_response = MagicMock()
-            mock_http_response.read.return_value = (
-                b'{"response": "# Meeting Summary", "prompt_eval_count": 70, "eval_count": 30}'
-            )
-            mock_http_response.__enter__ = lambda s: s
-            mock_http_response.__exit__ = MagicMock(return_value=False)
-            mock_urlopen.return_value = mock_http_response
-
-            service = SummarizationService()
+        with patch(
+            "urllib.request.urlopen", return_value=_FakeHTTP(_OLLAMA_SUMMARY_BODY)
+        ) as mock_urlopen:
             request = SummarizationRequest(
                 transcript="Alice: Hello. Bob: Hi.",
                 provider=LLMProvider.OLLAMA,
                 model="llama3",
             )
-            result = service._summarize_ollama(request)
+            result = summarization_service._summarize_ollama(request)
 
         mock_urlopen.assert_called_once()
         call_args = mock_urlopen.call_args
@@ -493,41 +524,35 @@ class TestSummarizeOllamaProvider:
         assert result.model == "llama3"
         assert result.token_count == 100
 
-    def test_ollama_does_not_require_api_key(self) -> None:
+    def test_ollama_does_not_require_api_key(
+        self, summarization_service: SummarizationService
+    ) -> None:
         """Verify _summarize_ollama does not raise ValueError when api_key is None."""
-        with patch("summarization.providers.urllib.request.urlopen") as mock_urlopen:
-            mock_http_response = MagicMock()
-            mock_http_response.read.return_value = (
-                b'{"response": "summary", "prompt_eval_count": 10, "eval_count": 5}'
-            )
-            mock_http_response.__enter__ = lambda s: s
-            mock_http_response.__exit__ = MagicMock(return_value=False)
-            mock_urlopen.return_value = mock_http_response
-
-            service = SummarizationService()
+        with patch("urllib.request.urlopen", return_value=_FakeHTTP(_OLLAMA_SUMMARY_BODY)):
             request = SummarizationRequest(
                 transcript="test",
                 provider=LLMProvider.OLLAMA,
                 model="llama3",
                 api_key=None,
             )
-            result = service._summarize_ollama(request)
+            result = summarization_service._summarize_ollama(request)
             assert result.provider == LLMProvider.OLLAMA
 
-    def test_ollama_raises_connectionerror_on_failure(self) -> None:
+    def test_ollama_raises_connectionerror_on_failure(
+        self, summarization_service: SummarizationService
+    ) -> None:
         """Verify _summarize_ollama raises ConnectionError when HTTP request fails."""
         with patch(
-            "summarization.providers.urllib.request.urlopen",
+            "urllib.request.urlopen",
             side_effect=Exception("Connection refused"),
         ):
-            service = SummarizationService()
             request = SummarizationRequest(
                 transcript="test",
                 provider=LLMProvider.OLLAMA,
                 model="llama3",
             )
             with pytest.raises(ConnectionError, match="Failed to connect to ollama"):
-                service._summarize_ollama(request)
+                summarization_service._summarize_ollama(request)
 
 
 class TestHandleSummarizeIntegration:
@@ -535,9 +560,6 @@ class TestHandleSummarizeIntegration:
 
     def test_handle_summarize_returns_complete_response_format(self) -> None:
         """Verify handle_summarize returns response with markdown, provider, model, token_count."""
-        from ipc.handlers import handle_summarize
-        from ipc.protocol import IPCMessage, MessageType
-
         with patch("summarization.providers.SummarizationService.summarize") as mock_summarize:
             mock_summarize.return_value = SummarizationResult(
                 markdown="# Meeting Summary",
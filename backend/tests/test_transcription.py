@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import dataclasses
+import logging
 import struct
 import sys
+import types
+import wave
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import numpy as np
@@ -13,45 +19,81 @@ import pytest
 from transcription.engine import TranscriptionEngine, TranscriptionSegment
 
 
+def _mlx_modules(
+    mock_mlx_whisper: MagicMock, transcribe_module: MagicMock | None = None
+) -> dict[str, Any]:
+    """Return sys.modules entries that stand in for mlx-whisper and mlx.core."""
+    return {
+        "mlx_whisper": mock_mlx_whisper,
+        "mlx_whisper.transcribe": transcribe_module or MagicMock(),
+        "mlx_whisper.audio": MagicMock(),
+        "mlx_whisper.load_models": MagicMock(),
+        "mlx.core": MagicMock(),
+    }
+
+
+class _FakeWhisperModel(dict[str, Any]):
+    """Stand-in for an mlx_whisper model, which keeps child modules as dict items."""
+
+    def __init__(self) -> None:
+        super().__init__(encoder=MagicMock(name="encoder"))
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def decode(self, mel: Any) -> Any:
+        """Mirror mlx_whisper's DecodingTask, which calls the encoder directly."""
+        return self.encoder(mel)
+
+
+@pytest.fixture(scope="module")
+def engine() -> Iterator[TranscriptionEngine]:
+    """Provide one default-configured engine shared across this module.
+
+    Tests that depend on the unloaded state must call ``unload_model()`` first.
+    """
+    shared = TranscriptionEngine()
+    yield shared
+    shared.unload_model()
+
+
 class TestTranscriptionEngine:
     """Tests for TranscriptionEngine initialization and basic behavior."""
 
-    def test_engine_initializes_with_default_model(self) -> None:
+    def test_engine_initializes_with_default_model(self, engine: TranscriptionEngine) -> None:
         """Verify that the engine has a sensible default model name."""
-        engine = TranscriptionEngine()
         assert "whisper" in engine.model_name
 
-    def test_transcribe_raises_without_model_loaded(self) -> None:
-        """Verify that transcribing before loading raises RuntimeError."""
-        engine = TranscriptionEngine()
-        with pytest.raises(RuntimeError, match="Model not loaded"):
-            engine.transcribe(b"fake audio data")
-
-    def test_load_model_enables_transcription(self) -> None:
-        """Verify that load_model sets the engine to a ready state."""
+    @pytest.mark.parametrize(
+        ("ops", "ready"),
+        [
+            pytest.param((), False, id="never-loaded"),
+            pytest.param(("load",), True, id="loaded"),
+            pytest.param(("load", "unload"), False, id="unloaded"),
+        ],
+    )
+    def test_transcribe_requires_loaded_model(
+        self, engine: TranscriptionEngine, ops: tuple[str, ...], ready: bool
+    ) -> None:
+        """Verify transcribe works only while a model is loaded."""
         mock_mlx = MagicMock()
         mock_mlx.transcribe.return_value = {"text": "", "segments": []}
-        engine = TranscriptionEngine()
-        with patch.dict(sys.modules, {"mlx_whisper": mock_mlx}):
-            engine.load_model()
-        # Should not raise — returns empty list
-        audio_bytes = struct.pack("<4h", 0, 0, 0, 0)
-        result = engine.transcribe(audio_bytes)
-        assert isinstance(result, list)
-
-    def test_unload_model_prevents_transcription(self) -> None:
-        """Verify that unload_model resets the engine state."""
-        mock_mlx = MagicMock()
-        engine = TranscriptionEngine()
-        with patch.dict(sys.modules, {"mlx_whisper": mock_mlx}):
-            engine.load_model()
         engine.unload_model()
-        with pytest.raises(RuntimeError):
-            engine.transcribe(b"fake audio data")
+        with patch.dict(sys.modules, _mlx_modules(mock_mlx)):
+            for op in ops:
+                getattr(engine, f"{op}_model")()
+        audio_bytes = struct.pack("<4h", 0, 0, 0, 0)
+        if ready:
+            assert engine.transcribe(audio_bytes) == []
+        else:
+            with pytest.raises(RuntimeError, match="Model not loaded"):
+                engine.transcribe(audio_bytes)
 
-    def test_engine_initializes_with_default_language(self) -> None:
+    def test_engine_initializes_with_default_language(self, engine: TranscriptionEngine) -> None:
         """Verify that the engine defaults to auto-detect (None)."""
-        engine = TranscriptionEngine()
         assert engine.language is None
 
     def test_engine_accepts_custom_language(self) -> None:
@@ -64,23 +106,135 @@ class TestTranscriptionEngine:
         engine = TranscriptionEngine(model_name="mlx-community/whisper-tiny")
         assert engine.model_name == "mlx-community/whisper-tiny"
 
-    def test_load_model_raises_when_mlx_whisper_not_installed(self) -> None:
+    def test_load_model_raises_when_mlx_whisper_not_installed(
+        self, engine: TranscriptionEngine
+    ) -> None:
         """Verify that load_model raises RuntimeError when mlx_whisper is unavailable."""
-        engine = TranscriptionEngine()
+        engine.unload_model()
         # Ensure mlx_whisper cannot be imported
         with patch.dict(sys.modules, {"mlx_whisper": None}):
             with pytest.raises(RuntimeError, match="mlx-whisper is not installed"):
                 engine.load_model()
 
-    def test_load_model_succeeds_when_mlx_whisper_available(self) -> None:
+    def test_load_model_succeeds_when_mlx_whisper_available(
+        self, engine: TranscriptionEngine
+    ) -> None:
         """Verify that load_model succeeds when mlx_whisper is importable."""
+        engine.unload_model()
         mock_mlx_whisper = MagicMock()
-        engine = TranscriptionEngine()
-        with patch.dict(sys.modules, {"mlx_whisper": mock_mlx_whisper}):
+        with patch.dict(sys.modules, _mlx_modules(mock_mlx_whisper)):
             engine.load_model()
         assert engine._model_loaded is True
 
-    def test_transcribe_parses_mlx_whisper_output_into_segments(self) -> None:
+    def test_load_model_compiles_audio_encoder_once(self) -> None:
+        """Verify the encoder is wrapped in mx.compile once and used by decoding."""
+        model = _FakeWhisperModel()
+        encoder = model.encoder
+        modules = _mlx_modules(MagicMock())
+        modules["mlx_whisper.transcribe"].ModelHolder.get_model.return_value = model
+        mx = modules["mlx.core"]
+        engine = TranscriptionEngine()
+        with patch.dict(sys.modules, modules):
+            engine.load_model()
+            engine.load_model()
+
+        mx.compile.assert_called_once_with(encoder)
+        assert model.decode("mel") is mx.compile.return_value.return_value
+        mx.compile.return_value.assert_called_once_with("mel")
+
+    def test_preload_loads_model_without_explicit_load_call(self) -> None:
+        """Verify an engine built with preload=True transcribes without load_model()."""
+        mock_mlx_whisper = MagicMock()
+        mock_mlx_whisper.transcribe.return_value = {"text": "", "segments": []}
+        with patch.dict(sys.modules, _mlx_modules(mock_mlx_whisper)):
+            engine = TranscriptionEngine(preload=True)
+            assert engine.transcribe(struct.pack("<4h", 0, 0, 0, 0)) == []
+            engine.unload_model()
+
+    def test_preload_failure_surfaces_on_first_transcribe(self) -> None:
+        """Verify a failed background load raises its error from transcribe()."""
+        with patch.dict(sys.modules, {"mlx_whisper": None}):
+            engine = TranscriptionEngine(preload=True)
+            with pytest.raises(RuntimeError, match="mlx-whisper is not installed"):
+                engine.transcribe(struct.pack("<4h", 0, 0, 0, 0))
+
+    def test_preload_surfaces_non_runtime_errors(self) -> None:
+        """Verify an OSError from reading the weights reaches transcribe() too."""
+        modules = _mlx_modules(MagicMock())
+        get_model = modules["mlx_whisper.transcribe"].ModelHolder.get_model
+        get_model.side_effect = OSError("weights.safetensors is truncated")
+        with patch.dict(sys.modules, modules):
+            engine = TranscriptionEngine(preload=True)
+            with pytest.raises(OSError, match="truncated"):
+                engine.transcribe(struct.pack("<4h", 0, 0, 0, 0))
+
+    def test_unload_after_failed_preload_does_not_raise(self) -> None:
+        """Verify unload_model() waits for a failed preload and discards its error."""
+        with patch.dict(sys.modules, {"mlx_whisper": None}):
+            engine = TranscriptionEngine(preload=True)
+            engine.unload_model()
+
+        assert engine._preload_thread is None
+        assert engine._preload_error is None
+        assert engine._model_loaded is False
+
+    def test_load_model_does_not_reload_on_second_transcribe(
+        self, engine: TranscriptionEngine
+    ) -> None:
+        """Verify weights load once and are re-pinned in mlx_whisper's cache per call."""
+        engine.unload_model()
+        mock_mlx_whisper = MagicMock()
+        mock_mlx_whisper.transcribe.return_value = {"text": "", "segments": []}
+        transcribe_module = MagicMock()
+        holder = transcribe_module.ModelHolder
+        audio_bytes = struct.pack("<4h", 0, 0, 0, 0)
+        with patch.dict(sys.modules, _mlx_modules(mock_mlx_whisper, transcribe_module)):
+            engine.load_model()
+            for _ in range(3):
+                holder.model = None  # another model evicted ours from the cache
+                engine.transcribe(audio_bytes)
+                assert holder.model is holder.get_model.return_value
+                assert holder.model_path == engine.model_name
+            engine.unload_model()
+
+        holder.get_model.assert_called_once()
+        assert holder.model is None
+
+    def test_transcribe_hands_int16_samples_to_mlx(self, engine: TranscriptionEngine) -> None:
+        """Verify transcribe builds the mx.array from int16 and scales it inside MLX."""
+        engine.unload_model()
+        mock_mlx_whisper = MagicMock()
+        mock_mlx_whisper.transcribe.return_value = {"text": "", "segments": []}
+        modules = _mlx_modules(mock_mlx_whisper)
+        mx = modules["mlx.core"]
+        with patch.dict(sys.modules, modules):
+            engine.load_model()
+            engine.transcribe(struct.pack("<2h", 16384, -16384))
+
+        (samples,), _ = mx.array.call_args
+        assert samples.dtype == np.int16
+        np.testing.assert_array_equal(samples, [16384, -16384])
+        mx.array.return_value.astype.assert_called_once_with(mx.float32)
+        mx.array.return_value.astype.return_value.__mul__.assert_called_once_with(1 / 32768)
+        audio_arg = mock_mlx_whisper.transcribe.call_args[0][0]
+        assert audio_arg is mx.array.return_value.astype.return_value.__mul__.return_value
+
+    def test_mlx_conversion_is_exact_over_full_int16_range(self) -> None:
+        """Verify every int16 sample converts bit-exactly to sample / 32768 in float32.
+
+        NumPy stands in for mlx.core: both cast int16 to IEEE float32 and multiply
+        in float32, so this pins the cast dtype and the scale the engine applies.
+        """
+        engine = TranscriptionEngine()
+        engine._mx = types.SimpleNamespace(array=np.asarray, float32=np.float32)
+        samples = np.arange(-32768, 32768, dtype=np.int16)
+        result = engine._prepare_mx_audio(samples)
+        assert result.dtype == np.float32
+        np.testing.assert_array_equal(result, samples.astype(np.float32) / np.float32(32768.0))
+
+    def test_transcribe_parses_mlx_whisper_output_into_segments(
+        self, engine: TranscriptionEngine
+    ) -> None:
         """Verify transcribe converts mlx_whisper result into TranscriptionSegment list."""
         mock_mlx_whisper = MagicMock()
         mock_mlx_whisper.transcribe.return_value = {
@@ -90,8 +244,7 @@ class TestTranscriptionEngine:
                 {"text": " world", "start": 0.5, "end": 1.0},
             ],
         }
-        engine = TranscriptionEngine()
-        with patch.dict(sys.modules, {"mlx_whisper": mock_mlx_whisper}):
+        with patch.dict(sys.modules, _mlx_modules(mock_mlx_whisper)):
             engine.load_model()
             # Build valid 16-bit PCM audio (4 samples of silence)
             audio_bytes = struct.pack("<4h", 0, 0, 0, 0)
@@ -106,12 +259,13 @@ class TestTranscriptionEngine:
         assert segments[1].end == 1.0
         assert all(not seg.is_partial for seg in segments)
 
-    def test_transcribe_passes_initial_prompt_to_mlx_whisper(self) -> None:
+    def test_transcribe_passes_initial_prompt_to_mlx_whisper(
+        self, engine: TranscriptionEngine
+    ) -> None:
         """Verify that the initial_prompt is forwarded to mlx_whisper.transcribe()."""
         mock_mlx_whisper = MagicMock()
         mock_mlx_whisper.transcribe.return_value = {"text": "", "segments": []}
-        engine = TranscriptionEngine()
-        with patch.dict(sys.modules, {"mlx_whisper": mock_mlx_whisper}):
+        with patch.dict(sys.modules, _mlx_modules(mock_mlx_whisper)):
             engine.load_model()
             audio_bytes = struct.pack("<4h", 0, 0, 0, 0)
             engine.transcribe(audio_bytes, initial_prompt="Alice Bob standup")
@@ -124,7 +278,7 @@ class TestTranscriptionEngine:
         mock_mlx_whisper = MagicMock()
         mock_mlx_whisper.transcribe.return_value = {"text": "", "segments": []}
         engine = TranscriptionEngine(language="ja")
-        with patch.dict(sys.modules, {"mlx_whisper": mock_mlx_whisper}):
+        with patch.dict(sys.modules, _mlx_modules(mock_mlx_whisper)):
             engine.load_model()
             audio_bytes = struct.pack("<4h", 0, 0, 0, 0)
             engine.transcribe(audio_bytes)
@@ -132,101 +286,377 @@ class TestTranscriptionEngine:
         call_kwargs = mock_mlx_whisper.transcribe.call_args
         assert call_kwargs[1]["language"] == "ja"
 
-    def test_unload_model_releases_mlx_whisper_reference(self) -> None:
+    @pytest.mark.parametrize(("dtype", "fp16"), [("float16", True), ("float32", False)])
+    def test_dtype_sets_model_precision_and_fp16_flag(
+        self, tmp_path: Path, dtype: str, fp16: bool
+    ) -> None:
+        """Verify the configured dtype reaches both the weight load and transcribe()."""
+        mock_mlx_whisper = MagicMock()
+        mock_mlx_whisper.transcribe.return_value = {"text": "", "segments": []}
+        modules = _mlx_modules(mock_mlx_whisper)
+        engine = TranscriptionEngine(dtype=dtype)
+        with patch.dict(sys.modules, modules):
+            engine.load_model()
+            engine.transcribe(struct.pack("<4h", 0, 0, 0, 0))
+            engine.transcribe_file(tmp_path / "missing.wav")
+
+        get_model = modules["mlx_whisper.transcribe"].ModelHolder.get_model
+        get_model.assert_called_once_with(engine.model_name, getattr(modules["mlx.core"], dtype))
+        for call in mock_mlx_whisper.transcribe.call_args_list:
+            assert call[1]["fp16"] is fp16
+
+    def test_engine_rejects_unsupported_dtype(self) -> None:
+        """Verify that a dtype mlx_whisper cannot decode with is rejected up front."""
+        with pytest.raises(ValueError, match="Unsupported dtype"):
+            TranscriptionEngine(dtype="bfloat16")
+
+    def test_unload_model_releases_mlx_whisper_reference(self, engine: TranscriptionEngine) -> None:
         """Verify that unload_model clears the internal mlx_whisper module reference."""
         mock_mlx_whisper = MagicMock()
-        engine = TranscriptionEngine()
-        with patch.dict(sys.modules, {"mlx_whisper": mock_mlx_whisper}):
+        with patch.dict(sys.modules, _mlx_modules(mock_mlx_whisper)):
             engine.load_model()
         assert engine._mlx_whisper is not None
         engine.unload_model()
         assert engine._mlx_whisper is None
         assert engine._model_loaded is False
 
-    def test_transcribe_file_reads_file_and_delegates_to_mlx_whisper(self) -> None:
+    def test_unload_model_clears_mlx_buffer_cache(self, engine: TranscriptionEngine) -> None:
+        """Verify unload returns MLX's cached buffers instead of only dropping references."""
+        modules = _mlx_modules(MagicMock())
+        with patch.dict(sys.modules, modules):
+            engine.load_model()
+        engine.unload_model()
+        engine.unload_model()
+        modules["mlx.core"].clear_cache.assert_called_once_with()
+
+    def test_transcribe_file_reads_file_and_delegates_to_mlx_whisper(
+        self, engine: TranscriptionEngine, tmp_path: Path
+    ) -> None:
         """Verify that transcribe_file reads a file path and passes audio to mlx_whisper."""
+        audio_path = tmp_path / "meeting.wav"
+        with wave.open(str(audio_path), "wb") as wav:
+            wav.setnchannels(1)
+            wav.setsampwidth(2)
+            wav.setframerate(16000)
+            wav.writeframes(struct.pack("<2h", 16384, -16384))
         mock_mlx_whisper = MagicMock()
         mock_mlx_whisper.transcribe.return_value = {
             "text": "From file",
             "segments": [{"text": " From file", "start": 0.0, "end": 1.5}],
         }
-        engine = TranscriptionEngine()
-        with patch.dict(sys.modules, {"mlx_whisper": mock_mlx_whisper}):
+        modules = _mlx_modules(mock_mlx_whisper)
+        mx = modules["mlx.core"]
+        with patch.dict(sys.modules, modules):
             engine.load_model()
-            segments = engine.transcribe_file("/tmp/test.wav")
+            segments = engine.transcribe_file(str(audio_path))
 
-        # transcribe_file should call mlx_whisper.transcribe with the file path string
+        # The samples are read from the file and handed to mlx_whisper as an array
+        (samples,), _ = mx.array.call_args
+        np.testing.assert_array_equal(samples, [16384, -16384])
         mock_mlx_whisper.transcribe.assert_called_once()
-        call_args = mock_mlx_whisper.transcribe.call_args
-        assert call_args[0][0] == "/tmp/test.wav"
+        audio_arg = mock_mlx_whisper.transcribe.call_args[0][0]
+        assert audio_arg is mx.array.return_value.astype.return_value.__mul__.return_value
         assert len(segments) == 1
         assert segments[0].text == " From file"
 
-    def test_transcribe_file_accepts_path_object(self) -> None:
+    def test_transcribe_file_accepts_path_object(
+        self, engine: TranscriptionEngine, tmp_path: Path
+    ) -> None:
         """Verify that transcribe_file accepts a Path object as well as a string."""
+        audio_path = tmp_path / "missing.wav"
         mock_mlx_whisper = MagicMock()
         mock_mlx_whisper.transcribe.return_value = {"text": "", "segments": []}
-        engine = TranscriptionEngine()
-        with patch.dict(sys.modules, {"mlx_whisper": mock_mlx_whisper}):
+        with patch.dict(sys.modules, _mlx_modules(mock_mlx_whisper)):
             engine.load_model()
-            engine.transcribe_file(Path("/tmp/test.wav"))
+            engine.transcribe_file(audio_path)
 
+        # A file that cannot be read locally is passed to mlx_whisper by path
         call_args = mock_mlx_whisper.transcribe.call_args
-        assert call_args[0][0] == "/tmp/test.wav"
+        assert call_args[0][0] == str(audio_path)
 
-    def test_transcribe_file_raises_when_model_not_loaded(self) -> None:
+    def test_transcribe_file_raises_when_model_not_loaded(
+        self, engine: TranscriptionEngine, tmp_path: Path
+    ) -> None:
         """Verify that transcribe_file raises RuntimeError when model not loaded."""
-        engine = TranscriptionEngine()
+        engine.unload_model()
         with pytest.raises(RuntimeError, match="Model not loaded"):
-            engine.transcribe_file("/tmp/test.wav")
+            engine.transcribe_file(tmp_path / "missing.wav")
 
-    def test_transcribe_file_passes_initial_prompt(self) -> None:
+    def test_transcribe_file_passes_initial_prompt(
+        self, engine: TranscriptionEngine, tmp_path: Path
+    ) -> None:
         """Verify that transcribe_file forwards initial_prompt to mlx_whisper."""
         mock_mlx_whisper = MagicMock()
         mock_mlx_whisper.transcribe.return_value = {"text": "", "segments": []}
-        engine = TranscriptionEngine()
-        with patch.dict(sys.modules, {"mlx_whisper": mock_mlx_whisper}):
+        with patch.dict(sys.modules, _mlx_modules(mock_mlx_whisper)):
             engine.load_model()
-            engine.transcribe_file("/tmp/test.wav", initial_prompt="Sprint review")
+            engine.transcribe_file(tmp_path / "missing.wav", initial_prompt="Sprint review")
 
         call_kwargs = mock_mlx_whisper.transcribe.call_args
         assert call_kwargs[1]["initial_prompt"] == "Sprint review"
 
+    def test_transcribe_file_decodes_each_file_version_once(self, tmp_path: Path) -> None:
+        """Verify repeat transcribe_file calls reuse cached samples until the file changes."""
+        audio_path = tmp_path / "meeting.m4a"
+        audio_path.write_bytes(b"v1")
+        mock_mlx_whisper = MagicMock()
+        mock_mlx_whisper.transcribe.return_value = {"text": "", "segments": []}
+        modules = _mlx_modules(mock_mlx_whisper)
+        load_audio = modules["mlx_whisper.audio"].load_audio
+        load_audio.return_value = np.array([0.5, -0.5], dtype=np.float32)
+        mx = modules["mlx.core"]
+        engine = TranscriptionEngine()
+        with patch.dict(sys.modules, modules):
+            engine.load_model()
+            engine.transcribe_file(audio_path)
+            engine.transcribe_file(audio_path)
+            assert load_audio.call_count == 1
+            (samples,), _ = mx.array.call_args
+            np.testing.assert_array_equal(samples, np.array([16384, -16384], dtype=np.int16))
+
+            audio_path.write_bytes(b"v2-longer")
+            engine.transcribe_file(audio_path)
+            assert load_audio.call_count == 2
+
+        assert not list(tmp_path.glob("**/*.npy"))
+
+    def test_transcribe_file_evicts_cached_samples_of_deleted_file(self, tmp_path: Path) -> None:
+        """Verify decoded samples are dropped once their source file is deleted."""
+        audio_path = tmp_path / "meeting.m4a"
+        audio_path.write_bytes(b"v1")
+        mock_mlx_whisper = MagicMock()
+        mock_mlx_whisper.transcribe.return_value = {"text": "", "segments": []}
+        modules = _mlx_modules(mock_mlx_whisper)
+        modules["mlx_whisper.audio"].load_audio.return_value = np.zeros(4, dtype=np.float32)
+        engine = TranscriptionEngine()
+        with patch.dict(sys.modules, modules):
+            engine.load_model()
+            engine.transcribe_file(audio_path)
+            assert engine._audio_cache_bytes == 8
+
+            audio_path.unlink()
+            engine.transcribe_file(audio_path)
+
+        assert not engine._audio_cache
+        assert engine._audio_cache_bytes == 0
+
+    @pytest.mark.parametrize(
+        ("rate", "channels", "mapped"),
+        [(16000, 1, True), (44100, 1, False), (16000, 2, False)],
+    )
+    def test_transcribe_file_memory_maps_16khz_mono_wav(
+        self, tmp_path: Path, rate: int, channels: int, mapped: bool
+    ) -> None:
+        """Verify only WAVs already in Whisper's input format bypass ffmpeg decoding."""
+        audio_path = tmp_path / "meeting.wav"
+        with wave.open(str(audio_path), "wb") as wav:
+            wav.setnchannels(channels)
+            wav.setsampwidth(2)
+            wav.setframerate(rate)
+            wav.writeframes(struct.pack("<4h", 100, -200, 300, -400))
+        mock_mlx_whisper = MagicMock()
+        mock_mlx_whisper.transcribe.return_value = {"text": "", "segments": []}
+        modules = _mlx_modules(mock_mlx_whisper)
+        load_audio = modules["mlx_whisper.audio"].load_audio
+        load_audio.return_value = np.zeros(4, dtype=np.float32)
+        engine = TranscriptionEngine()
+        with patch.dict(sys.modules, modules):
+            engine.load_model()
+            engine.transcribe_file(audio_path)
+
+        assert load_audio.called is not mapped
+        if mapped:
+            (samples,), _ = modules["mlx.core"].array.call_args
+            assert isinstance(samples, np.memmap)
+            np.testing.assert_array_equal(samples, [100, -200, 300, -400])
+
+    def test_transcribe_skips_whisper_for_silent_chunk(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Verify a chunk below the speech gate is logged and skipped without mlx_whisper."""
+        engine = TranscriptionEngine(speech_gate_dbfs=-46.0)
+        mock_mlx_whisper = MagicMock()
+        with (
+            patch.dict(sys.modules, _mlx_modules(mock_mlx_whisper)),
+            caplog.at_level(logging.DEBUG, logger="transcription.engine"),
+        ):
+            engine.load_model()
+            segments = engine.transcribe(np.zeros(16000, dtype=np.int16).tobytes())
 
-class TestPrepareAudio:
-    """Tests for the _prepare_audio method that converts PCM bytes to numpy arrays."""
+        assert segments == []
+        mock_mlx_whisper.transcribe.assert_not_called()
+        assert "speech gate" in caplog.text
 
-    def test_converts_16bit_pcm_to_float32_array(self) -> None:
-        """Verify that 16-bit PCM bytes are converted to a float32 numpy array."""
-        engine = TranscriptionEngine()
-        # 4 samples of 16-bit signed PCM
-        audio_bytes = struct.pack("<4h", 0, 16384, -16384, 32767)
-        result = engine._prepare_audio(audio_bytes)
-        assert result.dtype == np.float32
-        assert len(result) == 4
+    def test_transcribe_empty_audio_skips_whisper(self, engine: TranscriptionEngine) -> None:
+        """Verify empty input returns no segments without building an array or invoking Whisper."""
+        mock_mlx_whisper = MagicMock()
+        modules = _mlx_modules(mock_mlx_whisper)
+        with patch.dict(sys.modules, modules):
+            engine.load_model()
+            assert engine.transcribe(b"") == []
 
-    def test_normalizes_pcm_values_to_minus_one_to_one(self) -> None:
-        """Verify that PCM values are normalized to the [-1, 1] range."""
-        engine = TranscriptionEngine()
-        # Max positive and max negative 16-bit values
-        audio_bytes = struct.pack("<2h", 32767, -32768)
-        result = engine._prepare_audio(audio_bytes)
-        assert result[0] == pytest.approx(32767 / 32768.0, abs=1e-5)
-        assert result[1] == pytest.approx(-32768 / 32768.0, abs=1e-5)
-
-    def test_silence_converts_to_zeros(self) -> None:
-        """Verify that silent PCM audio (all zeros) produces a zero array."""
+        modules["mlx.core"].array.assert_not_called()
+        mock_mlx_whisper.transcribe.assert_not_called()
+
+    def test_transcribe_speech_gate_is_off_by_default(self, engine: TranscriptionEngine) -> None:
+        """Verify quiet audio still reaches mlx_whisper when no gate is configured."""
+        mock_mlx_whisper = MagicMock()
+        mock_mlx_whisper.transcribe.return_value = {"segments": []}
+        with patch.dict(sys.modules, _mlx_modules(mock_mlx_whisper)):
+            engine.load_model()
+            engine.transcribe(np.full(16000, 50, dtype=np.int16).tobytes())
+
+        mock_mlx_whisper.transcribe.assert_called_once()
+
+    def test_transcribe_trims_silence_and_keeps_chunk_relative_timestamps(self) -> None:
+        """Verify leading/trailing silence is trimmed and segment times shifted back."""
+        engine = TranscriptionEngine(speech_gate_dbfs=-46.0)
+        mock_mlx_whisper = MagicMock()
+        mock_mlx_whisper.transcribe.return_value = {
+            "segments": [{"text": " Hi", "start": 0.0, "end": 0.5}]
+        }
+        modules = _mlx_modules(mock_mlx_whisper)
+        # 66 frames of silence, 16 loud frames, 66 silent frames (30 ms = 480 samples)
+        audio = np.zeros(148 * 480, dtype=np.int16)
+        audio[66 * 480 : 82 * 480] = 8000
+        with patch.dict(sys.modules, modules):
+            engine.load_model()
+            segments = engine.transcribe(audio.tobytes())
+
+        (samples,), _ = modules["mlx.core"].array.call_args
+        # 300 ms of padding kept on both sides of the speech
+        assert len(samples) == (16 + 2 * 10) * 480
+        assert segments[0].start == pytest.approx(56 * 480 / 16000)
+        assert segments[0].end == pytest.approx(56 * 480 / 16000 + 0.5)
+
+    def test_transcribe_stream_chunk_carries_text_into_next_prompt(self) -> None:
+        """Verify each streaming chunk is prompted with the text decoded before it."""
+        mock_mlx_whisper = MagicMock()
+        mock_mlx_whisper.transcribe.side_effect = [
+            {"segments": [{"text": " Let's start", "start": 0.0, "end": 1.0}]},
+            {"segments": [{"text": " the standup.", "start": 0.0, "end": 1.0}]},
+            {"segments": []},
+        ]
         engine = TranscriptionEngine()
         audio_bytes = struct.pack("<4h", 0, 0, 0, 0)
-        result = engine._prepare_audio(audio_bytes)
-        np.testing.assert_array_equal(result, np.zeros(4, dtype=np.float32))
+        with patch.dict(sys.modules, _mlx_modules(mock_mlx_whisper)):
+            engine.load_model()
+            engine.transcribe_stream_chunk(audio_bytes, initial_prompt="Alice Bob")
+            engine.transcribe_stream_chunk(audio_bytes, initial_prompt="Alice Bob")
+            engine.reset_stream()
+            engine.transcribe_stream_chunk(audio_bytes)
+
+        prompts = [c.kwargs["initial_prompt"] for c in mock_mlx_whisper.transcribe.call_args_list]
+        assert prompts == ["Alice Bob", "Alice Bob Let's start", ""]
+
+    def test_transcribe_files_returns_segments_per_path_in_order(
+        self, engine: TranscriptionEngine, tmp_path: Path
+    ) -> None:
+        """Verify transcribe_files transcribes each path and keeps input order."""
+        mock_mlx_whisper = MagicMock()
+        mock_mlx_whisper.transcribe.side_effect = [
+            {"segments": [{"text": " First", "start": 0.0, "end": 1.0}]},
+            {"segments": []},
+        ]
+        with patch.dict(sys.modules, _mlx_modules(mock_mlx_whisper)):
+            engine.load_model()
+            results = engine.transcribe_files(
+                [str(tmp_path / "a.wav"), tmp_path / "b.wav"], "Standup"
+            )
+
+        assert [[seg.text for seg in segs] for segs in results] == [[" First"], []]
+        paths = [c.args[0] for c in mock_mlx_whisper.transcribe.call_args_list]
+        assert paths == [str(tmp_path / "a.wav"), str(tmp_path / "b.wav")]
+        assert all(
+            c.kwargs["initial_prompt"] == "Standup"
+            for c in mock_mlx_whisper.transcribe.call_args_list
+        )
 
-    def test_empty_audio_returns_empty_array(self) -> None:
-        """Verify that empty bytes input produces an empty numpy array."""
+    def test_transcribe_adaptive_downgrades_and_recovers_with_latency(self) -> None:
+        """Verify sustained slow chunks switch to the fallback model and fast ones switch back."""
+        mock_mlx_whisper = MagicMock()
+        mock_mlx_whisper.transcribe.return_value = {"text": "", "segments": []}
+        modules = _mlx_modules(mock_mlx_whisper)
+        modules["huggingface_hub"] = hub = MagicMock()
+        hub.snapshot_download.return_value = "/models/whisper-tiny-mlx-q4"
+        get_model = modules["mlx_whisper.transcribe"].ModelHolder.get_model
+        load_weights = modules["mlx_whisper.load_models"].load_model
+        engine = TranscriptionEngine(fallback_model_name="mlx-community/whisper-tiny-mlx-q4")
+        audio = struct.pack("<4h", 20000, -20000, 20000, -20000)
+
+        def run(elapsed_ms: float) -> str:
+            with patch(
+                "transcription.engine.time.perf_counter", side_effect=[0.0, elapsed_ms / 1000]
+            ):
+                engine.transcribe_adaptive(audio, max_latency_ms=100)
+            return str(engine.get_metrics()["active_model"])
+
+        with patch.dict(sys.modules, modules):
+            engine.load_model()
+            run(5000)  # warmup, left out of the average
+            assert engine.get_metrics()["latency_ema_ms"] == 0.0
+            # The fallback downloads in the background while chunks stay on the primary.
+            assert [run(200) for _ in range(3)] == [engine.model_name] * 3
+            assert engine.get_metrics()["latency_ema_ms"] == pytest.approx(200)
+            assert engine._standby_thread is not None
+            engine._standby_thread.join()
+            load_weights.assert_not_called()
+            # Once the files are local, the next call loads them and switches.
+            assert run(200) == engine.fallback_model_name
+            assert engine.get_metrics()["latency_ema_ms"] == 0.0
+            run(5000)
+            assert mock_mlx_whisper.transcribe.call_args.kwargs["path_or_hf_repo"] == (
+                engine.fallback_model_name
+            )
+            # The average must stay below half the budget for three calls in a row,
+            # and the primary model is still loaded, so switching back is immediate.
+            assert [run(10) for _ in range(3)] == [engine.fallback_model_name] * 2 + [
+                engine.model_name
+            ]
+
+        get_model.assert_called_once()
+        assert get_model.call_args.args[0] == engine.model_name
+        hub.snapshot_download.assert_called_once_with(repo_id=engine.fallback_model_name)
+        load_weights.assert_called_once()
+        assert load_weights.call_args.args[0] == "/models/whisper-tiny-mlx-q4"
+
+    def test_transcribe_adaptive_stops_after_failed_fallback_download(self) -> None:
+        """Verify a failed fallback download is not retried on every later slow chunk."""
+        mock_mlx_whisper = MagicMock()
+        mock_mlx_whisper.transcribe.return_value = {"text": "", "segments": []}
+        modules = _mlx_modules(mock_mlx_whisper)
+        modules["huggingface_hub"] = hub = MagicMock()
+        hub.snapshot_download.side_effect = OSError("offline")
         engine = TranscriptionEngine()
-        result = engine._prepare_audio(b"")
-        assert result.dtype == np.float32
-        assert len(result) == 0
+        audio = struct.pack("<4h", 20000, -20000, 20000, -20000)
+
+        with patch.dict(sys.modules, modules):
+            engine.load_model()
+            for _ in range(10):
+                with patch("transcription.engine.time.perf_counter", side_effect=[0.0, 0.2]):
+                    engine.transcribe_adaptive(audio, max_latency_ms=100)
+                if engine._standby_thread is not None:
+                    engine._standby_thread.join()
+
+        hub.snapshot_download.assert_called_once()
+        modules["mlx_whisper.load_models"].load_model.assert_not_called()
+        assert engine.get_metrics()["active_model"] == engine.model_name
+
+    def test_transcribe_adaptive_leaves_gated_chunks_out_of_the_average(self) -> None:
+        """Verify chunks that skip Whisper are not timed and do not move the average."""
+        mock_mlx_whisper = MagicMock()
+        engine = TranscriptionEngine(speech_gate_dbfs=-46.0)
+        with (
+            patch.dict(sys.modules, _mlx_modules(mock_mlx_whisper)),
+            patch("transcription.engine.time.perf_counter", side_effect=AssertionError),
+        ):
+            engine.load_model()
+            for audio in (b"", np.zeros(16000, dtype=np.int16).tobytes()):
+                assert engine.transcribe_adaptive(audio, max_latency_ms=100) == []
+
+        mock_mlx_whisper.transcribe.assert_not_called()
+        assert engine._latency_samples == 0
+        assert engine.get_metrics()["latency_ema_ms"] == 0.0
 
 
 class TestTranscriptionSegment:
@@ -245,10 +675,26 @@ class TestTranscriptionSegment:
         assert segment.end == 3.0
         assert segment.is_partial is True
 
+    def test_segment_is_immutable_and_hashable(self) -> None:
+        """Verify that segments cannot be modified and dedupe by value."""
+        segment = TranscriptionSegment(text="hi", start=0.0, end=1.0)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            segment.text = "bye"  # type: ignore[misc]
+        assert {segment, TranscriptionSegment(text="hi", start=0.0, end=1.0)} == {segment}
+
 
 class TestHandleTranscribeChunkIntegration:
     """Tests for the IPC handler integration with transcription response format."""
 
+    @pytest.fixture(autouse=True)
+    def _reset_engine_cache(self) -> Iterator[None]:
+        """Start each test without engines cached by the handlers, and drop any it loads."""
+        from ipc import handlers
+
+        handlers._transcription_engines.clear()
+        yield
+        handlers._transcription_engines.clear()
+
     def test_handler_returns_segments_list_in_response(self) -> None:
         """Verify that handle_transcribe_chunk returns segments in the response."""
         from ipc.handlers import handle_transcribe_chunk
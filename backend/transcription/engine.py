@@ -6,19 +6,123 @@ Runs on Apple Silicon via the MLX framework for low-latency, on-device inference
 
 from __future__ import annotations
 
+import gc
 import importlib
-import types
+import logging
+import operator
+import os
+import threading
+import time
+import wave
+from collections import OrderedDict
+from collections.abc import Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+# 1/32768 is a power of two, so multiplying by it is exact and matches dividing.
+_PCM16_SCALE = np.float32(1.0 / 32768.0)
+
+_SAMPLE_RATE = 16000
+
+# Optional energy gate applied before Whisper (see speech_gate_dbfs): 30 ms
+# frames whose RMS stays below the threshold count as silence, and 300 ms of
+# context is kept around speech.
+_VAD_FRAME_SAMPLES = 480
+_VAD_PAD_FRAMES = 10
+
+# Decoded text carried into the next streaming chunk's prompt. mlx_whisper keeps
+# only the most recent 223 prompt tokens; this bounds what the engine stores.
+_STREAM_PROMPT_MAX_CHARS = 800
+
+# Fields read from each segment dict in mlx_whisper's transcribe() output.
+_SEG_FIELDS = operator.itemgetter("text", "start", "end")
+
+# Weight precisions mlx_whisper can decode with: its decoder only accepts
+# fp16 or fp32 audio features, so bfloat16 is not an option.
+_MODEL_DTYPES = ("float16", "float32")
+
+# Bytes of decoded audio transcribe_file() keeps in memory (about 2.3 hours of
+# 16 kHz int16 samples), least recently used evicted first.
+_AUDIO_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+_TURBO_MODEL = "mlx-community/whisper-large-v3-turbo"
+_SMALL_Q4_MODEL = "mlx-community/whisper-small-mlx-q4"
+
+# transcribe_adaptive(): smoothing of the per-chunk latency average, how many
+# calls in a row must agree before switching models, and the fraction of the
+# budget the average must drop under before moving back to the primary model.
+_LATENCY_EMA_ALPHA = 0.2
+_ADAPTIVE_SWITCH_CALLS = 3
+_ADAPTIVE_UPGRADE_HEADROOM = 0.5
+
+
+def _speech_bounds(samples: np.ndarray, min_mean_square: float) -> tuple[int, int] | None:
+    """Find the sample range that spans all detected speech in int16 PCM.
+
+    This is a cheap energy gate, not a full VAD: it only trims leading and
+    trailing silence and flags chunks that are silent throughout.
+
+    Args:
+        samples: 16 kHz int16 PCM samples.
+        min_mean_square: Frame mean square (in int16 units) above which a
+            frame counts as speech.
+
+    Returns:
+        ``(start, end)`` sample offsets to keep, or None if the chunk is silent.
+        Chunks shorter than one frame are kept whole.
+    """
+    n_frames = samples.size // _VAD_FRAME_SAMPLES
+    if n_frames == 0:
+        return (0, samples.size) if samples.size else None
+    frames = samples[: n_frames * _VAD_FRAME_SAMPLES].reshape(n_frames, _VAD_FRAME_SAMPLES)
+    frames = frames.astype(np.float32)
+    mean_square = np.einsum("ij,ij->i", frames, frames) / _VAD_FRAME_SAMPLES
+    active = np.flatnonzero(mean_square > min_mean_square)
+    if active.size == 0:
+        return None
+    start = max(int(active[0]) - _VAD_PAD_FRAMES, 0) * _VAD_FRAME_SAMPLES
+    last_frame = int(active[-1]) + 1 + _VAD_PAD_FRAMES
+    end = samples.size if last_frame >= n_frames else last_frame * _VAD_FRAME_SAMPLES
+    return start, end
+
+
+def _memmap_wav(path: str) -> np.ndarray | None:
+    """Map the samples of a 16 kHz, 16-bit mono WAV file without decoding it.
+
+    Args:
+        path: Path to the audio file.
+
+    Returns:
+        A read-only int16 memmap of the samples, or None if the file is not a
+        WAV in exactly that format (it then needs ffmpeg to resample or mix down).
+    """
+    if not path.lower().endswith(".wav"):
+        return None
+    try:
+        with open(path, "rb") as f, wave.open(f) as wav:
+            fmt = (wav.getframerate(), wav.getsampwidth(), wav.getnchannels())
+            if fmt != (_SAMPLE_RATE, 2, 1):
+                return None
+            n_frames = wav.getnframes()
+            # wave stops reading at the start of the data chunk's payload.
+            data_offset = f.tell()
+        return np.memmap(path, dtype="<i2", mode="r", offset=data_offset, shape=(n_frames,))
+    except (OSError, EOFError, ValueError, wave.Error):
+        return None
+
+
+@dataclass(slots=True, frozen=True)
 class TranscriptionSegment:
     """A single transcribed segment with timing information.
 
+    Segments are immutable and hashable, so repeated streaming results can be
+    deduplicated with a set.
+
     Attributes:
         text: The transcribed text.
         start: Start time in seconds.
@@ -39,77 +143,374 @@ class TranscriptionEngine:
         engine = TranscriptionEngine(model_name="mlx-community/whisper-large-v3-turbo")
         engine.load_model()
         segments = engine.transcribe(audio_bytes)
+
+    4-bit quantized mlx-community checkpoints (e.g. whisper-large-v3-turbo-q4)
+    load the same way via ``model_name``; mlx_whisper dequantizes them on the fly.
+
+    With ``preload=True`` the weights start loading on a background thread at
+    construction, and the first transcribe call waits for that load instead of
+    requiring load_model().
+
+    ``speech_gate_dbfs`` enables an energy gate in transcribe(): chunks whose
+    30 ms frames all stay below that level are skipped without running Whisper,
+    and silence around speech is trimmed. It is off by default, since a fixed
+    level can drop quiet speakers or far-field microphones.
     """
 
     def __init__(
         self,
-        model_name: str = "mlx-community/whisper-large-v3-turbo",
+        model_name: str = _TURBO_MODEL,
         language: str | None = None,
+        dtype: str = "float16",
+        preload: bool = False,
+        fallback_model_name: str = _SMALL_Q4_MODEL,
+        speech_gate_dbfs: float | None = None,
     ) -> None:
+        if dtype not in _MODEL_DTYPES:
+            raise ValueError(f"Unsupported dtype: {dtype!r}. Expected one of {_MODEL_DTYPES}")
         self.model_name = model_name
         self.language = language
+        self.dtype = dtype
+        self.fallback_model_name = fallback_model_name
+        self.speech_gate_dbfs = speech_gate_dbfs
         self._model_loaded = False
-        self._mlx_whisper: types.ModuleType | None = None
+        self._mlx_whisper: Any = None
+        # The model transcribe calls run on, and its name: model_name, or
+        # fallback_model_name while transcribe_adaptive() has downgraded. The
+        # other loaded model, if any, waits in _standby_model.
+        self._model: Any = None
+        self._active_model = model_name
+        self._standby_model: Any = None
+        self._latency_ema_ms = 0.0
+        self._latency_samples = 0
+        self._switch_streak = 0
+        # Background download of the model to switch to, the local directory it
+        # produced, and whether it failed (then no switch is attempted again
+        # until the next load_model()).
+        self._standby_thread: threading.Thread | None = None
+        self._standby_path: str | None = None
+        self._standby_failed = False
+        self._model_holder: Any = None
+        self._mx: Any = None
+        self._load_weights: Any = None
+        self._load_audio: Any = None
+        self._stream_prompt = ""
+        # Decoded samples of non-WAV files, by absolute path, with the
+        # (mtime_ns, size) they were decoded from.
+        self._audio_cache: OrderedDict[str, tuple[int, int, np.ndarray]] = OrderedDict()
+        self._audio_cache_bytes = 0
+        self._audio_cache_lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._preload_thread: threading.Thread | None = None
+        self._preload_error: Exception | None = None
+        if preload:
+            self._preload_thread = threading.Thread(
+                target=self._preload, name="whisper-preload", daemon=True
+            )
+            self._preload_thread.start()
 
     def load_model(self) -> None:
-        """Load the whisper model into memory via lazy import.
+        """Load the whisper model weights into memory via lazy import.
+
+        mlx_whisper.transcribe() caches a single model in its ModelHolder and
+        re-reads the weights from disk whenever it is asked for a different
+        model. The weights are loaded here once, and every transcribe call
+        re-pins them in that cache so they are never reloaded per chunk.
+
+        The audio encoder is wrapped in mx.compile. Its input is always one
+        padded 30 s mel window, so it traces once, on the first transcribe
+        call (expect a few seconds of warmup there), and every later chunk
+        reuses the fused graph.
 
         Raises:
             RuntimeError: If mlx-whisper is not installed.
         """
+        with self._load_lock:
+            try:
+                mlx_whisper = importlib.import_module("mlx_whisper")
+                holder = importlib.import_module("mlx_whisper.transcribe").ModelHolder
+                load_weights = importlib.import_module("mlx_whisper.load_models").load_model
+                load_audio = importlib.import_module("mlx_whisper.audio").load_audio
+                mx = importlib.import_module("mlx.core")
+            except ImportError:
+                raise RuntimeError("mlx-whisper is not installed. Run: pip install mlx-whisper")
+            self._model_holder = holder
+            self._mx = mx
+            self._load_weights = load_weights
+            self._model = self._fetch_model(self.model_name)
+            self._active_model = self.model_name
+            self._standby_model = None
+            self._standby_path = None
+            self._standby_failed = False
+            self._reset_latency()
+            self._load_audio = load_audio
+            self._mlx_whisper = mlx_whisper
+            self._model_loaded = True
+
+    def _fetch_model(self, name: str) -> Any:
+        """Load a model's weights through mlx_whisper's ModelHolder and compile its encoder.
+
+        Args:
+            name: Model name or path, as for ``model_name``.
+
+        Returns:
+            The loaded model.
+        """
+        # Must match the fp16 flag passed to transcribe(), which casts the mel
+        # spectrogram and checks the encoder output against it.
+        return self._compile_encoder(
+            self._model_holder.get_model(name, getattr(self._mx, self.dtype))
+        )
+
+    def _compile_encoder(self, model: Any) -> Any:
+        """Wrap a loaded model's audio encoder in mx.compile, once.
+
+        Args:
+            model: A loaded mlx_whisper model.
+
+        Returns:
+            The same model.
+        """
+        # mlx_whisper's decoder runs model.encoder(mel) directly. The encoder is
+        # a child module stored as a dict item, so the compiled wrapper set as an
+        # attribute shadows it. get_model() hands back its cached instance for
+        # the same path, which an earlier load may already have compiled.
+        if "encoder" not in vars(model):
+            model.encoder = self._mx.compile(model.encoder)
+        return model
+
+    def _download_standby(self, name: str) -> None:
+        """Fetch a model's weight files on the standby thread.
+
+        Only the download runs here. MLX does not document using arrays or
+        compiled functions from several threads at once, so building the model
+        is left to the thread that runs inference (see transcribe_adaptive()).
+
+        Args:
+            name: Model name or path to fetch.
+        """
         try:
-            self._mlx_whisper = importlib.import_module("mlx_whisper")
-        except ImportError:
-            raise RuntimeError("mlx-whisper is not installed. Run: pip install mlx-whisper")
-        self._model_loaded = True
+            if os.path.exists(name):
+                path = name
+            else:
+                hub = importlib.import_module("huggingface_hub")
+                path = hub.snapshot_download(repo_id=name)
+        except Exception:
+            logger.warning("Fetching standby model %s failed", name, exc_info=True)
+            self._standby_failed = True
+            return
+        self._standby_path = path
+
+    def _reset_latency(self) -> None:
+        """Forget the latency average and switch streak kept by transcribe_adaptive()."""
+        self._latency_ema_ms = 0.0
+        self._latency_samples = 0
+        self._switch_streak = 0
+
+    def _preload(self) -> None:
+        """Run load_model() on the preload thread, keeping its error for the caller.
+
+        Any exception is kept, not just RuntimeError: weight downloads and reads
+        can fail with OSError and friends, and an exception escaping a thread
+        would be lost instead of reaching the first transcribe call.
+        """
+        try:
+            self.load_model()
+        except Exception as e:
+            self._preload_error = e
+
+    def _wait_for_preload(self) -> Exception | None:
+        """Block until the load started by ``preload=True`` has finished.
+
+        Returns:
+            The exception the background load failed with, if any. It is
+            handed out once; later calls return None.
+        """
+        thread = self._preload_thread
+        if thread is None:
+            return None
+        thread.join()
+        self._preload_thread = None
+        error, self._preload_error = self._preload_error, None
+        return error
 
     def unload_model(self) -> None:
-        """Release model from memory."""
-        self._model_loaded = False
-        self._mlx_whisper = None
+        """Release model from memory.
+
+        Dropping the model frees its arrays, but MLX keeps their Metal buffers
+        cached for reuse; that cache is cleared too so the memory goes back to
+        the system. The mlx_whisper modules stay imported for the next load.
+        A pending preload is waited for, and its error, if any, is discarded.
+        """
+        self._wait_for_preload()
+        standby_thread, self._standby_thread = self._standby_thread, None
+        if standby_thread is not None:
+            standby_thread.join()
+        with self._load_lock:
+            holder = self._model_holder
+            if holder is not None and holder.model is not None:
+                if holder.model is self._model or holder.model is self._standby_model:
+                    holder.model = None
+                    holder.model_path = None
+            mx = self._mx
+            self._model_loaded = False
+            self._mlx_whisper = None
+            self._model = None
+            self._active_model = self.model_name
+            self._standby_model = None
+            self._standby_path = None
+            self._standby_failed = False
+            self._reset_latency()
+            self._model_holder = None
+            self._mx = None
+            self._load_weights = None
+            self._load_audio = None
+            if mx is not None:
+                gc.collect()
+                # mx.clear_cache() replaced mx.metal.clear_cache() in newer MLX.
+                clear_cache = getattr(mx, "clear_cache", None) or mx.metal.clear_cache
+                clear_cache()
+
+    def _require_loaded(self) -> None:
+        """Wait for any preload, then check that a model is ready to transcribe.
+
+        Raises:
+            RuntimeError: If the model is not loaded.
+            Exception: Whatever the ``preload=True`` background load failed with.
+        """
+        error = self._wait_for_preload()
+        if error is not None:
+            raise error
+        if not self._model_loaded or self._mlx_whisper is None:
+            raise RuntimeError("Model not loaded. Call load_model() first.")
+
+    def _invoke(
+        self, audio: Any, initial_prompt: str, offset: float = 0.0
+    ) -> list[TranscriptionSegment]:
+        """Run mlx_whisper.transcribe() on the loaded model and parse its segments.
+
+        Args:
+            audio: A file path, or normalized float32 samples as an array.
+            initial_prompt: Prompt to condition the decoder on.
+            offset: Seconds to add to every segment timestamp.
+
+        Returns:
+            List of transcription segments.
+        """
+        self._pin_model()
+        result: dict[str, Any] = self._mlx_whisper.transcribe(
+            audio,
+            path_or_hf_repo=self._active_model,
+            language=self.language,
+            initial_prompt=initial_prompt,
+            fp16=self.dtype == "float16",
+        )
+        return self._parse_segments(result, offset)
+
+    def _pin_model(self) -> None:
+        """Point mlx_whisper's model cache at this engine's loaded weights."""
+        self._model_holder.model = self._model
+        self._model_holder.model_path = self._active_model
 
-    def _prepare_audio(self, audio_data: bytes) -> np.ndarray:
-        """Convert raw 16-bit PCM mono audio bytes to a float32 numpy array.
+    def _prepare_mx_audio(self, samples: np.ndarray) -> Any:
+        """Convert 16-bit PCM mono samples to a normalized float32 mx.array.
 
-        The input is expected to be 16kHz, 16-bit signed little-endian PCM mono.
-        The output is a float32 array normalized to the [-1, 1] range, as expected
-        by mlx-whisper.
+        mlx_whisper turns whatever it is given into an mx.array before computing
+        the mel spectrogram. Handing it the int16 samples copies half as many bytes
+        as a float32 array would, and leaves the cast and scale to MLX, which
+        evaluates them lazily on the GPU together with the mel computation.
 
         Args:
-            audio_data: Raw PCM audio bytes.
+            samples: int16 PCM samples.
 
         Returns:
-            Numpy float32 array normalized to [-1, 1].
+            mx.array of float32 samples normalized to [-1, 1].
         """
-        if len(audio_data) == 0:
-            return np.array([], dtype=np.float32)
-        samples = np.frombuffer(audio_data, dtype=np.int16)
-        return samples.astype(np.float32) / 32768.0
+        mx = self._mx
+        # A Python float keeps the product in MLX; a NumPy scalar could pull it back
+        # into NumPy via __rmul__.
+        return mx.array(samples).astype(mx.float32) * float(_PCM16_SCALE)
+
+    def _load_file_samples(self, path: str) -> np.ndarray | None:
+        """Decode an audio file to 16 kHz int16 samples, at most once per file version.
+
+        mlx_whisper decodes files by spawning ffmpeg on every call. The decoded
+        samples are kept in memory, keyed on the path and checked against its
+        mtime and size, so re-transcribing the same recording (e.g. once per
+        diarization pass) skips decoding. Nothing is written to disk, the cache
+        is bounded by bytes, and an entry is dropped as soon as its file is
+        found deleted or changed.
+
+        Args:
+            path: Path to the audio file.
+
+        Returns:
+            The samples, or None if the file cannot be found.
+        """
+        key = os.path.abspath(path)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            self._evict_audio(key)
+            return None
+        version = (stat.st_mtime_ns, stat.st_size)
+        with self._audio_cache_lock:
+            entry = self._audio_cache.get(key)
+            if entry is not None and entry[:2] == version:
+                self._audio_cache.move_to_end(key)
+                return entry[2]
+
+        # load_audio() divides ffmpeg's int16 output by 32768, so this is exact.
+        audio = np.asarray(self._load_audio(path), dtype=np.float32)
+        samples = (audio * 32768.0).astype(np.int16)
+        self._evict_audio(key)
+        if samples.nbytes <= _AUDIO_CACHE_MAX_BYTES:
+            with self._audio_cache_lock:
+                self._audio_cache[key] = (*version, samples)
+                self._audio_cache_bytes += samples.nbytes
+                while self._audio_cache_bytes > _AUDIO_CACHE_MAX_BYTES:
+                    _, (_, _, stale) = self._audio_cache.popitem(last=False)
+                    self._audio_cache_bytes -= stale.nbytes
+        return samples
+
+    def _evict_audio(self, key: str) -> None:
+        """Drop a file's decoded samples from the in-memory cache, if present.
+
+        Args:
+            key: Absolute path of the audio file.
+        """
+        with self._audio_cache_lock:
+            entry = self._audio_cache.pop(key, None)
+            if entry is not None:
+                self._audio_cache_bytes -= entry[2].nbytes
 
-    def _parse_segments(self, result: dict[str, Any]) -> list[TranscriptionSegment]:
+    def _parse_segments(
+        self, result: dict[str, Any], offset: float = 0.0
+    ) -> list[TranscriptionSegment]:
         """Parse mlx_whisper transcribe() output into TranscriptionSegment list.
 
         Args:
             result: The dict returned by mlx_whisper.transcribe(), containing
                     a "segments" key with list of dicts having "text", "start", "end".
+            offset: Seconds to add to every timestamp, e.g. for trimmed leading silence.
 
         Returns:
             List of TranscriptionSegment instances.
         """
-        segments: list[TranscriptionSegment] = []
-        for seg in result.get("segments", []):
-            segments.append(
-                TranscriptionSegment(
-                    text=seg["text"],
-                    start=seg["start"],
-                    end=seg["end"],
-                )
-            )
-        return segments
+        return [
+            TranscriptionSegment(text, start + offset, end + offset)
+            for text, start, end in map(_SEG_FIELDS, result.get("segments", ()))
+        ]
 
     def transcribe(self, audio_data: bytes, initial_prompt: str = "") -> list[TranscriptionSegment]:
         """Transcribe an audio chunk.
 
+        When ``speech_gate_dbfs`` is set, leading and trailing silence is trimmed
+        before the model runs, and chunks with no frame above the gate return no
+        segments without invoking Whisper. Empty input returns no segments
+        without invoking Whisper either, rather than decoding 30 s of padding.
+        Segment timestamps stay relative to the start of ``audio_data``.
+
         Args:
             audio_data: Raw audio bytes (16kHz, 16-bit PCM mono).
             initial_prompt: Optional prompt with speaker names for improved accuracy.
@@ -120,25 +521,183 @@ class TranscriptionEngine:
         Raises:
             RuntimeError: If the model is not loaded.
         """
-        if not self._model_loaded or self._mlx_whisper is None:
-            raise RuntimeError("Model not loaded. Call load_model() first.")
+        self._require_loaded()
+        speech = self._speech_samples(audio_data)
+        if speech is None:
+            return []
+        return self._invoke_samples(*speech, initial_prompt)
 
-        audio_array = self._prepare_audio(audio_data)
-        result: dict[str, Any] = self._mlx_whisper.transcribe(
-            audio_array,
-            path_or_hf_repo=self.model_name,
-            language=self.language,
-            initial_prompt=initial_prompt,
-        )
-        return self._parse_segments(result)
+    def _speech_samples(self, audio_data: bytes) -> tuple[np.ndarray, int] | None:
+        """Decode a chunk and cut it to the part worth running Whisper on.
+
+        Args:
+            audio_data: Raw audio bytes (16kHz, 16-bit PCM mono).
+
+        Returns:
+            The int16 samples to transcribe and their offset in samples from the
+            start of the chunk, or None if the chunk is empty or entirely below
+            the speech gate.
+        """
+        if not audio_data:
+            return None
+        samples = np.frombuffer(audio_data, dtype=np.int16)
+        if self.speech_gate_dbfs is None:
+            return samples, 0
+        min_mean_square = (10.0 ** (self.speech_gate_dbfs / 20.0) * 32768.0) ** 2
+        bounds = _speech_bounds(samples, min_mean_square)
+        if bounds is None:
+            logger.debug(
+                "Skipping %.2f s chunk below the %.1f dBFS speech gate",
+                samples.size / _SAMPLE_RATE,
+                self.speech_gate_dbfs,
+            )
+            return None
+        start, end = bounds
+        return samples[start:end], start
+
+    def _invoke_samples(
+        self, samples: np.ndarray, start: int, initial_prompt: str
+    ) -> list[TranscriptionSegment]:
+        """Run Whisper on int16 samples that begin ``start`` samples into their chunk."""
+        audio_array = self._prepare_mx_audio(samples)
+        return self._invoke(audio_array, initial_prompt, offset=start / _SAMPLE_RATE)
+
+    def transcribe_stream_chunk(
+        self, audio_data: bytes, initial_prompt: str = ""
+    ) -> list[TranscriptionSegment]:
+        """Transcribe the next chunk of a live stream, conditioned on earlier chunks.
+
+        The text decoded so far is appended to the prompt, so names, spelling
+        and sentence context carry across chunk boundaries instead of each chunk
+        starting cold. Call reset_stream() when a new recording starts.
+
+        Only the text carries over, not the decoder's key/value cache. Above the
+        first layer, the decoder's self-attention states depend on cross-attention
+        over the chunk's own audio, so states cached for one chunk are wrong for
+        the next, and the prompt tokens have to be re-run against each new chunk.
+
+        Args:
+            audio_data: Raw audio bytes (16kHz, 16-bit PCM mono).
+            initial_prompt: Optional prompt with speaker names, placed before the
+                carried-over text.
+
+        Returns:
+            List of transcription segments for this chunk.
+
+        Raises:
+            RuntimeError: If the model is not loaded.
+        """
+        prompt = f"{initial_prompt} {self._stream_prompt.lstrip()}".strip()
+        segments = self.transcribe(audio_data, initial_prompt=prompt)
+        text = "".join(seg.text for seg in segments)
+        if text:
+            self._stream_prompt = (self._stream_prompt + text)[-_STREAM_PROMPT_MAX_CHARS:]
+        return segments
+
+    def transcribe_adaptive(
+        self, audio_data: bytes, max_latency_ms: float, initial_prompt: str = ""
+    ) -> list[TranscriptionSegment]:
+        """Transcribe a chunk, switching to a faster model when falling behind real time.
+
+        Each call's Whisper time feeds an exponential moving average. Chunks
+        that skip Whisper (empty, or below the speech gate) are left out, as is
+        the first call after a load or a switch, since it includes the encoder's
+        compile and warmup. After three calls in a row with the average over
+        ``max_latency_ms``, ``fallback_model_name`` starts downloading on a
+        background thread while chunks keep running on the current model. Once
+        its files are local, the next call loads it between chunks, switches to
+        it, and keeps it loaded. If the download fails, the engine stays on the
+        current model. After three calls in a row under half the budget, chunks
+        move back to ``model_name``. The average and streak start over on every
+        switch.
+
+        Args:
+            audio_data: Raw audio bytes (16kHz, 16-bit PCM mono).
+            max_latency_ms: Time allowed to transcribe one chunk, in milliseconds.
+            initial_prompt: Optional prompt with speaker names for improved accuracy.
+
+        Returns:
+            List of transcription segments.
+
+        Raises:
+            RuntimeError: If the model is not loaded.
+        """
+        self._require_loaded()
+        speech = self._speech_samples(audio_data)
+        if speech is None:
+            return []
+        started = time.perf_counter()
+        segments = self._invoke_samples(*speech, initial_prompt)
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+        self._latency_samples += 1
+        if self._latency_samples == 1:
+            return segments
+        if self._latency_samples == 2:
+            self._latency_ema_ms = elapsed_ms
+        else:
+            self._latency_ema_ms += _LATENCY_EMA_ALPHA * (elapsed_ms - self._latency_ema_ms)
+
+        if self._active_model == self.model_name:
+            wants_switch = self._latency_ema_ms > max_latency_ms
+            target = self.fallback_model_name
+        else:
+            wants_switch = self._latency_ema_ms < max_latency_ms * _ADAPTIVE_UPGRADE_HEADROOM
+            target = self.model_name
+        self._switch_streak = self._switch_streak + 1 if wants_switch else 0
+        if self._switch_streak < _ADAPTIVE_SWITCH_CALLS:
+            return segments
+        with self._load_lock:
+            if self._standby_model is None and self._standby_path is not None:
+                # Loaded through mlx_whisper.load_models rather than ModelHolder,
+                # whose single cached model the transcribe path keeps re-pinning.
+                path, self._standby_path = self._standby_path, None
+                try:
+                    model = self._load_weights(path, getattr(self._mx, self.dtype))
+                    self._standby_model = self._compile_encoder(model)
+                except Exception:
+                    logger.warning("Loading standby model %s failed", target, exc_info=True)
+                    self._standby_failed = True
+            standby = self._standby_model
+            if standby is not None:
+                self._standby_model = self._model
+                self._model = standby
+                self._active_model = target
+                self._reset_latency()
+                return segments
+        downloading = self._standby_thread is not None and self._standby_thread.is_alive()
+        if not downloading and not self._standby_failed and self._standby_path is None:
+            self._standby_thread = threading.Thread(
+                target=self._download_standby,
+                args=(target,),
+                name="whisper-standby",
+                daemon=True,
+            )
+            self._standby_thread.start()
+        return segments
+
+    def get_metrics(self) -> dict[str, float | str]:
+        """Report the adaptive transcription state.
+
+        Returns:
+            Dict with ``latency_ema_ms``, the moving average of per-chunk time in
+            transcribe_adaptive(), and ``active_model``, the model chunks run on.
+        """
+        return {"latency_ema_ms": self._latency_ema_ms, "active_model": self._active_model}
+
+    def reset_stream(self) -> None:
+        """Forget the text carried over between streaming chunks."""
+        self._stream_prompt = ""
 
     def transcribe_file(
         self, audio_path: str | Path, initial_prompt: str = ""
     ) -> list[TranscriptionSegment]:
         """Transcribe audio from a file path.
 
-        This passes the file path directly to mlx_whisper.transcribe(), which
-        handles file reading internally. Useful for the post-meeting diarization flow.
+        16 kHz, 16-bit mono WAV files are memory-mapped directly. Other files are
+        decoded through mlx_whisper's ffmpeg loader and the samples are cached in
+        memory, so repeat calls on an unchanged file skip decoding. Paths that do not
+        exist are passed to mlx_whisper.transcribe() as-is. Useful for the
+        post-meeting diarization flow.
 
         Args:
             audio_path: Path to the audio file.
@@ -150,14 +709,31 @@ class TranscriptionEngine:
         Raises:
             RuntimeError: If the model is not loaded.
         """
-        if not self._model_loaded or self._mlx_whisper is None:
-            raise RuntimeError("Model not loaded. Call load_model() first.")
+        self._require_loaded()
+        path_str = os.fspath(audio_path)
+        samples = _memmap_wav(path_str)
+        if samples is None:
+            samples = self._load_file_samples(path_str)
+        audio = path_str if samples is None else self._prepare_mx_audio(samples)
+        return self._invoke(audio, initial_prompt)
+
+    def transcribe_files(
+        self, audio_paths: Sequence[str | Path], initial_prompt: str = ""
+    ) -> list[list[TranscriptionSegment]]:
+        """Transcribe several audio files with the already-loaded model.
+
+        mlx_whisper has no batched long-form transcribe(): its batched decode()
+        only handles single 30 s windows and returns no segment timestamps. So
+        files run one after another against the same pinned weights.
 
-        path_str = str(audio_path)
-        result: dict[str, Any] = self._mlx_whisper.transcribe(
-            path_str,
-            path_or_hf_repo=self.model_name,
-            language=self.language,
-            initial_prompt=initial_prompt,
-        )
-        return self._parse_segments(result)
+        Args:
+            audio_paths: Paths to the audio files.
+            initial_prompt: Optional prompt with speaker names, applied to every file.
+
+        Returns:
+            One list of transcription segments per input path, in input order.
+
+        Raises:
+            RuntimeError: If the model is not loaded.
+        """
+        return [self.transcribe_file(path, initial_prompt) for path in audio_paths]